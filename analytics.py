@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from event_log import EVENTS_PATH, CHOICE_CODES
+
+def _add(total, part):
+    return part if total is None else total.add(part, fill_value=0)
+
+def aggregate_events(path=EVENTS_PATH, chunksize=500_000):
+    """Aggregate the answer-event log chunk by chunk with vectorized group-bys.
+
+    Returns (scenario_stats, character_matches, overview). Only running
+    per-group sums are kept between chunks, so memory does not grow with the log.
+    """
+    choice_counts = None      # scenario x choice code -> answers
+    latency_sums = None       # scenario -> (sum of latency, count)
+    match_counts = None       # character -> times ranked #1
+    completed = 0
+    duration_totals = np.zeros(2)  # (sum of session duration, sessions with a duration)
+
+    for chunk in pd.read_json(path, lines=True, chunksize=chunksize):
+        answers = chunk[chunk['ev'] == 'answer']
+        if len(answers):
+            choice_counts = _add(choice_counts, answers.groupby(['scn', 'ch']).size())
+            latency_sums = _add(latency_sums, answers.groupby('scn')['lat'].agg(['sum', 'count']))
+
+        results = chunk[chunk['ev'] == 'result']
+        if len(results):
+            match_counts = _add(match_counts, results.groupby('top').size())
+            completed += len(results)
+            duration_totals += (results['dur'].sum(), results['dur'].count())
+
+    if choice_counts is None:
+        scenario_stats = pd.DataFrame(columns=['answers', *CHOICE_CODES, 'entropy', 'mean_latency'])
+    else:
+        distribution = choice_counts.unstack('ch', fill_value=0).reindex(columns=CHOICE_CODES, fill_value=0)
+        answers = distribution.sum(axis=1)
+        shares = distribution.div(answers, axis=0)
+        # Shannon entropy of the answer split (bits): near 0 means everyone answers
+        # the same way, i.e. the scenario does not discriminate between users
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropy = -(shares * np.log2(shares)).fillna(0).sum(axis=1)
+        scenario_stats = shares.round(3)
+        scenario_stats.insert(0, 'answers', answers.astype(int))
+        scenario_stats['entropy'] = entropy.round(3)
+        scenario_stats['mean_latency'] = (latency_sums['sum'] / latency_sums['count']).round(2)
+        scenario_stats.index = scenario_stats.index.astype(int)
+        scenario_stats.index.name = 'scenario'
+        scenario_stats.columns.name = None
+
+    if match_counts is None:
+        character_matches = pd.DataFrame(columns=['matches', 'share'])
+    else:
+        match_counts = match_counts.astype(int).sort_values(ascending=False)
+        character_matches = pd.DataFrame({
+            'matches': match_counts,
+            'share': (match_counts / match_counts.sum()).round(3),
+        })
+        character_matches.index.name = 'character'
+
+    overview = {
+        'completed_sessions': completed,
+        'mean_session_seconds': round(duration_totals[0] / duration_totals[1], 1) if duration_totals[1] else None,
+    }
+    return scenario_stats, character_matches, overview
+
+if __name__ == "__main__":
+    events_path = Path(sys.argv[1]) if len(sys.argv) > 1 else EVENTS_PATH
+    if not events_path.exists():
+        print(f"❌ No event log at {events_path}")
+        sys.exit(1)
+
+    scenario_stats, character_matches, overview = aggregate_events(events_path)
+
+    print("📊 Answer analytics")
+    print("=" * 50)
+    print(f"✅ Completed sessions: {overview['completed_sessions']}")
+    print(f"⏱️  Mean session length: {overview['mean_session_seconds']}s")
+    print("\n🎯 Per-scenario answer distribution (lowest entropy = least discriminating first)")
+    print(scenario_stats.sort_values('entropy').to_string())
+    print("\n💕 #1 match frequency")
+    print(character_matches.to_string())
+
+    out_dir = events_path.parent
+    scenario_stats.to_csv(out_dir / "scenario_stats.csv")
+    character_matches.to_csv(out_dir / "character_matches.csv")
+    print(f"\n📁 Tables saved to: {out_dir.absolute()}")
@@ -0,0 +1,107 @@
+# requires: pip install streamlit pillow
+# First-paint comparison for the top-5 result cards.
+#   python benchmarks/bench_first_paint.py [image_px] [repeat]
+# Both sides run inside Streamlit's script runtime (streamlit.testing AppTest), so
+# st.image does its real work: read the file, decode/resize it with Pillow and
+# register it with the media file manager. Times the server-side work before every
+# card has something to paint:
+#   legacy        - st.image(local path) per card, as the baseline did; cards without
+#                   a download get a via.placeholder.com URL (the browser fetch that
+#                   follows is not timed)
+#   placeholders  - load images/placeholders.json and emit each card's inline <img>;
+#                   the same st.image calls then follow after first paint
+# The test images are real JPEGs, so build_placeholders() makes blurred thumbnails.
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from placeholders import FALLBACK_COLOURS, build_placeholders, safe_image_name
+
+CARDS = 5
+
+def cards_script(images_dir, placeholders_path, names, repeat):
+    """Runs inside AppTest; records best-of-`repeat` timings in session_state"""
+    import time
+    import streamlit as st
+    from placeholders import load_placeholders, local_image_path, placeholder_html
+
+    def legacy():
+        for name in names:
+            image_path = local_image_path(name, images_dir)
+            if image_path:
+                st.image(str(image_path), width=200)
+            else:
+                st.image(f"https://via.placeholder.com/300x400/808080/FFFFFF?text={name.replace(' ', '+')}", width=200)
+
+    def placeholders_first(run):
+        placeholders = load_placeholders(placeholders_path)
+        cells = []
+        for i, name in enumerate(names):
+            cell = st.container(key=f"portrait-{run}-{i}")
+            cell.markdown(placeholder_html(placeholders[name], 200), unsafe_allow_html=True)
+            cells.append((cell, name))
+        return cells
+
+    def full_images(cells):
+        for cell, name in cells:
+            image_path = local_image_path(name, images_dir)
+            if image_path:
+                cell.image(str(image_path), width=200)
+
+    timings = {"legacy": [], "first_paint": [], "full_images": []}
+    for run in range(repeat):
+        with st.empty().container():
+            start = time.perf_counter()
+            legacy()
+            timings["legacy"].append(time.perf_counter() - start)
+        with st.empty().container():
+            start = time.perf_counter()
+            cells = placeholders_first(run)
+            timings["first_paint"].append(time.perf_counter() - start)
+            full_images(cells)
+            timings["full_images"].append(time.perf_counter() - start)
+    st.session_state["timings"] = {key: min(values) for key, values in timings.items()}
+
+def write_test_jpeg(path, size):
+    """Real JPEG with enough detail to be a realistic size"""
+    width, height = size
+    image = Image.effect_noise((width, height), 64).convert("RGB")
+    image = Image.blend(image, Image.linear_gradient("L").resize((width, height)).convert("RGB"), 0.5)
+    image.save(path, format="JPEG", quality=85)
+
+if __name__ == "__main__":
+    image_px = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    names = list(FALLBACK_COLOURS)[:CARDS]
+
+    with tempfile.TemporaryDirectory() as images_dir:
+        # Like the real images/ folder: most cards have a download, one falls back
+        for name in names[:-1]:
+            write_test_jpeg(Path(images_dir, f"{safe_image_name(name)}.jpg"), (image_px, image_px * 4 // 3))
+        image_kb = sum(p.stat().st_size for p in Path(images_dir).glob("*.jpg")) / 1024 / (CARDS - 1)
+
+        placeholders_path = Path(images_dir) / "placeholders.json"
+        start = time.perf_counter()
+        placeholders = build_placeholders(names, out_path=placeholders_path, images_dir=images_dir)
+        build_time = time.perf_counter() - start
+        thumbnails = sum(uri.startswith("data:image/jpeg") for uri in placeholders.values())
+        assert thumbnails == CARDS - 1, "expected a blurred thumbnail for every downloaded image"
+
+        at = AppTest.from_function(cards_script, args=(images_dir, placeholders_path, names, repeat),
+                                   default_timeout=120)
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        timings = at.session_state["timings"]
+
+    print(f"🖼️  Server-side time until all {CARDS} result cards can paint "
+          f"({CARDS - 1} local {image_px}px JPEGs of ~{image_kb:.0f}KB, 1 fallback)")
+    print(f"   legacy st.image per card:            {timings['legacy'] * 1000:8.2f} ms")
+    print(f"   placeholders.json + inline <img>:    {timings['first_paint'] * 1000:8.2f} ms")
+    print(f"     ...then full images stacked over:  {timings['full_images'] * 1000:8.2f} ms total")
+    print(f"   (offline) build_placeholders:        {build_time * 1000:8.2f} ms, {thumbnails} blurred thumbnails")
@@ -0,0 +1,70 @@
+# Server-side render benchmark for the results screen at 10k characters.
+#   python benchmarks/bench_results_formatter.py [n_rows]
+# "legacy" reproduces the old path: sort, then rank_df.iterrows() with one
+# st.write() per character. "formatter" is format_results() plus one
+# st.dataframe() of the current page. Streamlit isn't imported: st.write and
+# st.dataframe are replaced by mocks that serialize a delta message per call, the
+# per-widget work the server does before anything reaches the browser. Browser
+# paint time is not measured.
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from results_formatter import format_results, results_page
+
+def mock_st_write(markdown, deltas):
+    """Stand-in for st.write: one serialized delta per call"""
+    deltas.append(json.dumps({"delta_path": [0, len(deltas)], "markdown": {"body": markdown}}))
+
+def mock_st_dataframe(frame, deltas):
+    """Stand-in for st.dataframe: one serialized delta carrying the table"""
+    deltas.append(json.dumps({"delta_path": [0, len(deltas)], "dataframe": frame.to_json(orient="split")}))
+
+def legacy_render(names, summaries, match_scores):
+    rank_df = pd.DataFrame({
+        'name': names,
+        'summary': summaries,
+        'match_score': match_scores
+    }).sort_values('match_score', ascending=False).reset_index(drop=True)
+    deltas = []
+    for i, row in rank_df.iterrows():
+        total_chars = len(rank_df)
+        match_percentage = max(20, 100 - (i * (80 / max(total_chars - 1, 1))))
+        mock_st_write(f"**{i+1:2d}.** {row['name']:<25} | **{match_percentage:5.1f}%** | Score: {row['match_score']:+6.3f}", deltas)
+    return deltas
+
+def formatter_render(names, summaries, match_scores, page=1, page_size=50):
+    rank_df = format_results(names, summaries, match_scores)
+    deltas = []
+    mock_st_dataframe(results_page(rank_df, page, page_size), deltas)
+    return deltas
+
+def best_of(fn, *args, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+if __name__ == "__main__":
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = np.random.default_rng(0)
+    names = np.array([f"Character {i}" for i in range(n_rows)])
+    summaries = np.array([f"Summary for character {i}" for i in range(n_rows)])
+    match_scores = rng.normal(size=n_rows)
+
+    legacy = best_of(legacy_render, names, summaries, match_scores)
+    formatter = best_of(formatter_render, names, summaries, match_scores)
+    legacy_bytes = sum(map(len, legacy_render(names, summaries, match_scores)))
+    formatter_bytes = sum(map(len, formatter_render(names, summaries, match_scores)))
+
+    print(f"📊 Results server-side render benchmark ({n_rows:,} rows, mocked Streamlit deltas)")
+    print(f"   legacy iterrows + st.write:      {legacy * 1000:8.1f} ms, {n_rows:,} deltas, {legacy_bytes / 1024:8.1f}KB")
+    print(f"   format_results + st.dataframe:   {formatter * 1000:8.1f} ms, 1 delta, {formatter_bytes / 1024:8.1f}KB")
+    print(f"   speedup: {legacy / formatter:.1f}x")
@@ -0,0 +1,36 @@
+# Scoring-kernel benchmark across catalogue sizes.
+#   python benchmarks/bench_scoring.py [size ...]
+# "fit" is the one-off load-time cost; "score" is the per-request cost, which
+# should be the same single matrix-vector product for every kernel.
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scoring import KERNELS
+
+N_TRAITS = 20
+
+def best_of(fn, repeat=7):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000, 1_000_000]
+    rng = np.random.default_rng(0)
+    preferences = rng.normal(scale=3, size=N_TRAITS)
+
+    print(f"{'kernel':<12} {'n':>10} {'fit ms':>10} {'score ms':>10}")
+    for n in sizes:
+        traits = rng.random((n, N_TRAITS)) - 0.5
+        for name, kernel_cls in KERNELS.items():
+            kernel = kernel_cls()
+            fit = best_of(lambda: kernel.fit(traits), repeat=3)
+            score = best_of(lambda: kernel.score(preferences))
+            print(f"{name:<12} {n:>10,} {fit * 1000:>10.2f} {score * 1000:>10.3f}")
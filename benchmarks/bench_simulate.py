@@ -0,0 +1,24 @@
+# Throughput of the Monte-Carlo scenario simulator per worker count and kernel.
+#   python benchmarks/bench_simulate.py [n_sessions]
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from simulate import load_catalogue, simulate
+
+if __name__ == "__main__":
+    n_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    names, traits_norm, trait_cols = load_catalogue(ROOT / "data.csv")
+    worker_counts = sorted({1, os.cpu_count() or 1})
+
+    print(f"{'kernel':<12} {'workers':>7} {'seconds':>8} {'sessions/s':>12} {'top1 stable':>12}")
+    for kernel in ("dot", "cosine", "mahalanobis"):
+        for workers in worker_counts:
+            start = time.perf_counter()
+            stats = simulate(traits_norm, trait_cols, n_sessions, kernel=kernel, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"{kernel:<12} {workers:>7} {elapsed:>8.2f} {n_sessions / elapsed:>12,.0f} "
+                  f"{stats['top1_stability']:>12.1%}")
@@ -0,0 +1,66 @@
+import atexit
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+
+EVENTS_PATH = Path("events") / "answers.jsonl"
+
+# Choice codes logged for each answer, in the order of the five choice buttons
+CHOICE_CODES = ["strong_a", "a", "neutral", "b", "strong_b"]
+
+class EventSink:
+    """Append compact JSONL events from a background writer thread.
+
+    log() only enqueues, so Streamlit reruns never wait on disk I/O. If the
+    queue is full the event is dropped and counted rather than blocking.
+    """
+
+    def __init__(self, path=EVENTS_PATH, max_queue=10_000, flush_interval=1.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = object()
+        self._thread = threading.Thread(target=self._run, name="event-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, event, **fields):
+        """Queue one event, e.g. log("answer", sid=..., scn=3, ch=1, lat=2.4)"""
+        record = {"ts": round(time.time(), 3), "ev": event, **fields}
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """Flush queued events and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(self._stop)
+            self._thread.join()
+
+    def _run(self):
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+                # Drain whatever else is waiting so bursts become one write + flush
+                batch = [item]
+                while len(batch) < 1024:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = any(record is self._stop for record in batch)
+                lines = [json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+                         for record in batch if record is not self._stop]
+                if lines:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                if stop:
+                    return
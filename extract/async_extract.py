@@ -0,0 +1,215 @@
+# requires: pip install aiohttp
+# Async alternative to extract.py: talks to the MediaWiki API directly instead of
+# going through the `fandom` library, so wikis can be fetched concurrently.
+#   python extract/async_extract.py
+# Point API_URL at a local fake MediaWiki server (see fake_mediawiki.py) to run it offline.
+import os, json, sys, asyncio, urllib.parse
+from html.parser import HTMLParser
+from collections import defaultdict
+import aiohttp
+from waifu_list import waifus
+from status_journal import StatusJournal, atomic_write, write_json_summary, write_csv_summary
+
+API_URL = "https://{wiki}.fandom.com/api.php"
+MAX_TITLES_PER_QUERY = 50  # MediaWiki limit for titles= on non-bot accounts
+OUT_DIR = "waifu_fandom_pages"
+# Warnings meaning the request silently did less than asked (unsupported module/prop/parameter)
+FATAL_WARNINGS = ("Unrecognized value for parameter", "Unrecognized parameter", "Unrecognized values for parameter")
+
+
+async def api_get(session, api_url, params):
+    """GET one MediaWiki API request and return the decoded JSON body"""
+    params = {**params, "format": "json", "formatversion": "2"}
+    async with session.get(api_url, params=params) as resp:
+        resp.raise_for_status()
+        data = await resp.json(content_type=None)
+    if "error" in data:
+        raise RuntimeError(data["error"].get("info", data["error"]))
+    # An unsupported prop/module is reported as a warning, not an error; other
+    # warnings (deprecation notices and the like) are logged and ignored
+    for module, warning in data.get("warnings", {}).items():
+        text = warning.get("warnings", warning.get("*", "")) if isinstance(warning, dict) else str(warning)
+        if any(marker in text for marker in FATAL_WARNINGS):
+            raise RuntimeError(f"API warning ({module}): {text}")
+        print(f"⚠️  API warning ({module}): {text}")
+    return data
+
+
+async def query_titles(session, api_url, titles):
+    """Resolve up to 50 titles in one action=query, following redirects server-side.
+
+    Returns {requested title: page dict or None if missing}. Page dicts carry
+    `pageid`, `title` and `fullurl`.
+    """
+    params = {
+        "action": "query",
+        "titles": "|".join(titles),
+        "redirects": "1",
+        "prop": "info",
+        "inprop": "url",
+    }
+    normalized, redirects, pages = {}, {}, {}
+    cont = {}
+    while True:
+        data = await api_get(session, api_url, {**params, **cont})
+        query = data.get("query", {})
+        for n in query.get("normalized", []):
+            normalized[n["from"]] = n["to"]
+        for r in query.get("redirects", []):
+            redirects[r["from"]] = r["to"]
+        for page in query.get("pages", []):
+            pages.setdefault(page["title"], {}).update(page)
+        if "continue" not in data:
+            break
+        cont = data["continue"]
+
+    resolved = {}
+    for title in titles:
+        target = normalized.get(title, title)
+        # redirects=1 reports every hop of a chain (A→B, B→C) but only returns page C
+        seen = {target}
+        while target in redirects and redirects[target] not in seen:
+            target = redirects[target]
+            seen.add(target)
+        page = pages.get(target)
+        if page is None or page.get("missing") or page.get("invalid"):
+            resolved[title] = None
+        else:
+            resolved[title] = page
+    return resolved
+
+
+class _TextExtractor(HTMLParser):
+    """Collect plain text from parsed page HTML, skipping scripts, styles and tables"""
+    SKIP = {"script", "style", "table", "sup"}
+
+    def __init__(self):
+        super().__init__()
+        self.chunks, self.paragraphs = [], []
+        self._skip_depth = 0
+        self._paragraph = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skip_depth += 1
+        elif tag == "p" and not self._skip_depth:
+            self._paragraph = []
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "p" and self._paragraph is not None:
+            text = "".join(self._paragraph).strip()
+            if text:
+                self.paragraphs.append(text)
+            self._paragraph = None
+        elif tag in ("p", "h2", "h3", "h4", "li", "div"):
+            self.chunks.append("\n")
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        self.chunks.append(data)
+        if self._paragraph is not None:
+            self._paragraph.append(data)
+
+
+async def fetch_page_text(session, api_url, pageid):
+    """Fetch one page via action=parse (as the `fandom` library does) and return (summary, full_text)"""
+    data = await api_get(session, api_url, {
+        "action": "parse",
+        "pageid": str(pageid),
+        "prop": "text",
+    })
+    html = data.get("parse", {}).get("text")
+    if not html:
+        raise RuntimeError("action=parse returned no page text")
+    parser = _TextExtractor()
+    parser.feed(html)
+    full_text = "\n".join(line.strip() for line in "".join(parser.chunks).splitlines() if line.strip())
+    summary = parser.paragraphs[0] if parser.paragraphs else ""
+    return summary, full_text
+
+
+def save_page(name, page, summary, full_text):
+    data = {
+        "requested_name": name,
+        "resolved_title": page["title"],
+        "url": page.get("fullurl"),
+        "summary": summary,
+        "full_text": full_text
+    }
+    fname = os.path.join(OUT_DIR, f"{name.replace(' ', '_')}.json")
+    with atomic_write(fname, encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def fallback_url(name, wiki):
+    encoded = urllib.parse.quote(name.replace(" ", "_"))
+    return f"https://{wiki}.fandom.com/wiki/{encoded}"
+
+
+async def fetch_wiki(wiki, names, journal, api_url=API_URL, concurrency=4):
+    """Fetch every requested name on one wiki using a single pooled HTTP session.
+
+    Each status record is passed to `journal.append()` as soon as it completes
+    (a StatusJournal, or a plain list when testing).
+    """
+    url = api_url.format(wiki=wiki)
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+    timeout = aiohttp.ClientTimeout(total=60)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        resolved = {}
+        for i in range(0, len(names), MAX_TITLES_PER_QUERY):
+            batch = names[i:i + MAX_TITLES_PER_QUERY]
+            try:
+                resolved.update(await query_titles(session, url, batch))
+            except Exception as e:
+                resolved.update({name: e for name in batch})
+
+        async def fetch_one(name):
+            record = {"name": name, "wiki": wiki, "status": None, "url": None, "error": None}
+            page = resolved.get(name)
+            try:
+                if isinstance(page, Exception):
+                    raise page
+                if page is None:
+                    raise RuntimeError("Page not found")
+                summary, full_text = await fetch_page_text(session, url, page["pageid"])
+                save_page(name, page, summary, full_text)
+                record.update({"status": "fetched", "url": page.get("fullurl")})
+            except Exception as e:
+                record.update({"status": "fallback", "url": fallback_url(name, wiki), "error": str(e)})
+            journal.append(record)
+            print(f"{name} -> {record['status']}: {record['url']}")
+
+        await asyncio.gather(*(fetch_one(name) for name in names))
+
+
+async def fetch_all(pairs, journal, api_url=API_URL, concurrency=4):
+    """Fetch (name, wiki) pairs; wikis are fetched concurrently, one session each"""
+    by_wiki = defaultdict(list)
+    for name, wiki in pairs:
+        by_wiki[wiki].append(name)
+    await asyncio.gather(*(
+        fetch_wiki(wiki, names, journal, api_url=api_url, concurrency=concurrency)
+        for wiki, names in by_wiki.items()
+    ))
+
+
+if __name__ == "__main__":
+    # ensure UTF-8 stdout (Windows)
+    sys.stdout.reconfigure(encoding="utf-8")
+    os.makedirs(OUT_DIR, exist_ok=True)
+
+    journal_path = os.path.join(OUT_DIR, "fetch_status.jsonl")
+    with StatusJournal(journal_path) as journal:
+        asyncio.run(fetch_all(waifus, journal))
+
+    # save summary CSV/JSON (streamed from the journal, written atomically)
+    write_json_summary(journal_path, os.path.join(OUT_DIR, "fetch_status.json"))
+    write_csv_summary(journal_path, os.path.join(OUT_DIR, "fetch_status.csv"),
+                      fieldnames=["name", "wiki", "status", "url", "error"])
+    print(", ".join(f"{status}: {count}" for status, count in journal.counts().items()))
+
+    print("Done. Check fetch_status.json / fetch_status.csv for which pages need manual attention.")
@@ -1,42 +1,17 @@
 # requires: pip install fandom-py tqdm
-import os, json, sys, csv, urllib.parse
+import os, json, sys, urllib.parse
 import fandom
 from tqdm import tqdm
+from waifu_list import waifus
+from status_journal import StatusJournal, atomic_write, write_json_summary, write_csv_summary
 
 # ensure UTF-8 stdout (Windows)
 sys.stdout.reconfigure(encoding="utf-8")
 
-waifus = [
-    # ("Hinata Hyūga", "naruto"),
-    # ("Tsunade", "naruto"),
-    # ("Nezuko Kamado", "kimetsu-no-yaiba"),
-    # ("Mitsuri Kanroji", "kimetsu-no-yaiba"),
-    # ("Marin Kitagawa", "my-dress-up-darling"),
-    # ("Zero Two", "darling-in-the-franxx"),
-    # ("Maki Zenin", "jujutsu-kaisen"),
-    # ("Yor Forger", "spy-x-family"),
-    ("Rem", "saimoe"),
-    ("Asuna Yuuki", "hero"),
-    ("Nico Robin", "onepiece"),
-    # ("Erza Scarlet", "fairy-tail"),
-    ("Rias Gremory", "highschooldxd"),
-    ("Mai Sakurajima", "aobuta"),
-    ("C.C.", "codegeass"),
-    ("Emilia", "saimoe"),
-    # ("Kurisu Makise", "steins-gate"),
-    ("Shinobu Oshino", "bakemonogatari"),
-    # ("Tohru", "miss-kobayashis-dragon-maid"),
-    # ("Holo", "spice-and-wolf"),
-    # ("Power", "chainsaw-man"),
-    ("Shinobu Kocho", "kimetsu-no-yaiba"),
-#     ("Nobara Kugisaki", "jujutsu-kaisen"),
-#     ("Yoruichi Shihōin", "bleach"),
-#     ("Yukino Yukinoshita", "oregairu")
-]
-
 OUT_DIR = "waifu_fandom_pages"
 os.makedirs(OUT_DIR, exist_ok=True)
-status_rows = []
+JOURNAL_PATH = os.path.join(OUT_DIR, "fetch_status.jsonl")
+journal = StatusJournal(JOURNAL_PATH)
 
 for name, wiki in tqdm(waifus, desc="Fetching wiki pages"):
     fandom.set_wiki(wiki)
@@ -53,7 +28,7 @@ for name, wiki in tqdm(waifus, desc="Fetching wiki pages"):
             "full_text": page.plain_text
         }
         fname = os.path.join(OUT_DIR, f"{name.replace(' ', '_')}.json")
-        with open(fname, "w", encoding="utf-8") as f:
+        with atomic_write(fname, encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
     except Exception as e:
@@ -73,7 +48,7 @@ for name, wiki in tqdm(waifus, desc="Fetching wiki pages"):
                     "full_text": page.plain_text
                 }
                 fname = os.path.join(OUT_DIR, f"{name.replace(' ', '_')}.json")
-                with open(fname, "w", encoding="utf-8") as f:
+                with atomic_write(fname, encoding="utf-8") as f:
                     json.dump(data, f, ensure_ascii=False, indent=2)
             else:
                 raise RuntimeError("No search results")
@@ -82,16 +57,16 @@ for name, wiki in tqdm(waifus, desc="Fetching wiki pages"):
             encoded = urllib.parse.quote(name.replace(" ", "_"))
             fallback = f"https://{wiki}.fandom.com/wiki/{encoded}"
             record.update({"status": "fallback", "url": fallback, "error": str(e2 or e)})
-    status_rows.append(record)
+    journal.append(record)
     # safe console line (avoid printing raw unicode errors)
     print(f"{name} -> {record['status']}: {record['url']}")
 
-# save summary CSV/JSON
-with open(os.path.join(OUT_DIR, "fetch_status.json"), "w", encoding="utf-8") as f:
-    json.dump(status_rows, f, ensure_ascii=False, indent=2)
-with open(os.path.join(OUT_DIR, "fetch_status.csv"), "w", encoding="utf-8", newline='') as f:
-    w = csv.DictWriter(f, fieldnames=["name", "wiki", "status", "url", "error"])
-    w.writeheader()
-    w.writerows(status_rows)
+journal.close()
+
+# save summary CSV/JSON (streamed from the journal, written atomically)
+write_json_summary(JOURNAL_PATH, os.path.join(OUT_DIR, "fetch_status.json"))
+write_csv_summary(JOURNAL_PATH, os.path.join(OUT_DIR, "fetch_status.csv"),
+                  fieldnames=["name", "wiki", "status", "url", "error"])
+print(", ".join(f"{status}: {count}" for status, count in journal.counts().items()))
 
 print("Done. Check fetch_status.json / fetch_status.csv for which pages need manual attention.")
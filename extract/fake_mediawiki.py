@@ -0,0 +1,121 @@
+# requires: pip install aiohttp
+# Minimal fake MediaWiki API for running async_extract.py offline.
+#   python extract/fake_mediawiki.py            # serve on http://127.0.0.1:8765/{wiki}/api.php
+#   python extract/fake_mediawiki.py --check    # fetch a few pages through it and verify the results
+# Supports just what async_extract.py uses: action=query (titles, redirects=1, prop=info)
+# and action=parse (pageid, prop=text). Unknown props come back as `warnings`, like the real API.
+import os, sys, asyncio, json, tempfile
+from aiohttp import web
+
+HOST, PORT = "127.0.0.1", 8765
+API_URL = f"http://{HOST}:{PORT}/{{wiki}}/api.php"
+
+# wiki -> title -> (pageid, html)
+PAGES = {
+    "saimoe": {
+        "Rem (Re:Zero)": (1, "<p>Rem is a maid at Roswaal's mansion.</p><h2>History</h2><p>She is Ram's twin sister.</p>"),
+        "Emilia": (2, "<table><tr><td>infobox</td></tr></table><p>Emilia is a half-elf.</p>"),
+    },
+    "onepiece": {
+        "Nico Robin": (3, "<p>Nico Robin is the archaeologist of the Straw Hat Pirates.<sup>[1]</sup></p>"),
+    },
+}
+REDIRECTS = {"saimoe": {"Remu": "Rem", "Rem": "Rem (Re:Zero)"}}
+# Harmless warning the real API attaches to some responses; must not fail a fetch
+NOTICE = {"main": {"warnings": "Subscribe to the mediawiki-api-announce mailing list "
+                               "for notice of API deprecations and breaking changes."}}
+
+
+def query(wiki, params):
+    pages, normalized, redirects, warnings = [], [], [], {}
+    unknown = set(params.get("prop", "").split("|")) - {"info", ""}
+    if unknown:
+        warnings["main"] = {"warnings": f"Unrecognized value for parameter \"prop\": {'|'.join(sorted(unknown))}."}
+    for title in params["titles"].split("|"):
+        target = title.replace("_", " ")
+        if target != title:
+            normalized.append({"from": title, "to": target})
+        # Every hop of a redirect chain is reported, like the real API
+        while target in REDIRECTS.get(wiki, {}):
+            redirects.append({"from": target, "to": REDIRECTS[wiki][target]})
+            target = REDIRECTS[wiki][target]
+        if target in PAGES.get(wiki, {}):
+            pageid = PAGES[wiki][target][0]
+            url = f"https://{wiki}.fandom.com/wiki/{target.replace(' ', '_')}"
+            pages.append({"pageid": pageid, "ns": 0, "title": target, "fullurl": url})
+        else:
+            pages.append({"ns": 0, "title": target, "missing": True})
+    body = {"batchcomplete": True, "query": {"pages": pages}}
+    if normalized:
+        body["query"]["normalized"] = normalized
+    if redirects:
+        body["query"]["redirects"] = redirects
+    if warnings:
+        body["warnings"] = warnings
+    return body
+
+
+def parse(wiki, params):
+    pageid = int(params["pageid"])
+    for title, (pid, html) in PAGES.get(wiki, {}).items():
+        if pid == pageid:
+            return {"parse": {"title": title, "pageid": pid, "text": html}, "warnings": NOTICE}
+    return {"error": {"code": "nosuchpageid", "info": f"There is no page with ID {pageid}."}}
+
+
+async def api(request):
+    wiki = request.match_info["wiki"]
+    params = request.query
+    request.app["requests"].append(dict(params))
+    handler = {"query": query, "parse": parse}.get(params.get("action"))
+    if handler is None:
+        return web.json_response({"error": {"code": "badvalue", "info": "Unrecognized action"}})
+    return web.json_response(handler(wiki, params))
+
+
+def make_app():
+    app = web.Application()
+    app["requests"] = []
+    app.router.add_get("/{wiki}/api.php", api)
+    return app
+
+
+async def check():
+    import async_extract
+
+    runner = web.AppRunner(make_app())
+    await runner.setup()
+    await web.TCPSite(runner, HOST, PORT).start()
+    try:
+        with tempfile.TemporaryDirectory() as out_dir:
+            async_extract.OUT_DIR = out_dir
+            records = []
+            pairs = [("Rem", "saimoe"), ("Remu", "saimoe"), ("Emilia", "saimoe"),
+                     ("Nico Robin", "onepiece"), ("Nobody", "saimoe")]
+            await async_extract.fetch_all(pairs, records, api_url=API_URL)
+            status = {r["name"]: r["status"] for r in records}
+            assert status == {"Rem": "fetched", "Remu": "fetched", "Emilia": "fetched", "Nico Robin": "fetched", "Nobody": "fallback"}, status
+
+            with open(os.path.join(out_dir, "Rem.json"), encoding="utf-8") as f:
+                rem = json.load(f)
+            assert rem["resolved_title"] == "Rem (Re:Zero)", rem
+            assert rem["summary"] == "Rem is a maid at Roswaal's mansion.", rem
+            assert "She is Ram's twin sister." in rem["full_text"], rem
+
+            with open(os.path.join(out_dir, "Remu.json"), encoding="utf-8") as f:
+                assert json.load(f)["resolved_title"] == "Rem (Re:Zero)"
+
+            requests = runner.app["requests"]
+            queries = [r for r in requests if r["action"] == "query"]
+            assert len(queries) == 2, queries  # one batched action=query per wiki
+    finally:
+        await runner.cleanup()
+    print("✅ async_extract works against the fake MediaWiki server")
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding="utf-8")
+    if "--check" in sys.argv:
+        asyncio.run(check())
+    else:
+        web.run_app(make_app(), host=HOST, port=PORT)
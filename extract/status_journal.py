@@ -0,0 +1,97 @@
+# Append-only JSONL status journal shared by extract.py, async_extract.py and fetch_images.py.
+# Each result is written (and fsync'd) as soon as it completes, so a crash keeps every
+# finished record; end-of-run summaries are streamed from the journal into a temp file
+# and renamed into place, so memory stays flat and readers never see a half-written file.
+import os, json, csv, tempfile
+from collections import Counter
+from contextlib import contextmanager
+
+# mkstemp creates files as 0600; read the umask once (os.umask is process-wide and not thread-safe)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_write(path, mode="w", **open_kwargs):
+    """Write to a temp file next to `path`, then rename it over `path` on success"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # give the final file the same permissions a plain open() would have
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class StatusJournal:
+    """Append-only JSONL log of per-item results"""
+
+    def __init__(self, path, reset=True):
+        self.path = path
+        # a fresh run starts a fresh journal; reset=False appends to (resumes) an existing one
+        self._f = open(path, "w" if reset else "a", encoding="utf-8")
+
+    def append(self, record):
+        """Durably record one result"""
+        self._f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self):
+        if not self._f.closed:
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self):
+        return iter_journal(self.path)
+
+    def counts(self, key="status"):
+        return journal_counts(self.path, key)
+
+
+def iter_journal(path):
+    """Stream records from a journal, skipping a torn last line left by a crash"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def journal_counts(path, key="status"):
+    """Count records per value of `key` (e.g. {"fetched": 10, "fallback": 2})"""
+    return Counter(record.get(key) for record in iter_journal(path))
+
+
+def write_json_summary(journal_path, out_path):
+    """Stream journal records into a JSON array file, written atomically"""
+    with atomic_write(out_path, encoding="utf-8") as f:
+        f.write("[")
+        for i, record in enumerate(iter_journal(journal_path)):
+            f.write(",\n  " if i else "\n  ")
+            f.write(json.dumps(record, ensure_ascii=False))
+        f.write("\n]\n")
+
+
+def write_csv_summary(journal_path, out_path, fieldnames):
+    """Stream journal records into a CSV file, written atomically"""
+    with atomic_write(out_path, encoding="utf-8", newline='') as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        w.writeheader()
+        for record in iter_journal(journal_path):
+            w.writerow(record)
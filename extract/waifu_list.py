@@ -0,0 +1,28 @@
+# (name, fandom wiki subdomain) pairs fetched by extract.py / async_extract.py
+waifus = [
+    # ("Hinata Hyūga", "naruto"),
+    # ("Tsunade", "naruto"),
+    # ("Nezuko Kamado", "kimetsu-no-yaiba"),
+    # ("Mitsuri Kanroji", "kimetsu-no-yaiba"),
+    # ("Marin Kitagawa", "my-dress-up-darling"),
+    # ("Zero Two", "darling-in-the-franxx"),
+    # ("Maki Zenin", "jujutsu-kaisen"),
+    # ("Yor Forger", "spy-x-family"),
+    ("Rem", "saimoe"),
+    ("Asuna Yuuki", "hero"),
+    ("Nico Robin", "onepiece"),
+    # ("Erza Scarlet", "fairy-tail"),
+    ("Rias Gremory", "highschooldxd"),
+    ("Mai Sakurajima", "aobuta"),
+    ("C.C.", "codegeass"),
+    ("Emilia", "saimoe"),
+    # ("Kurisu Makise", "steins-gate"),
+    ("Shinobu Oshino", "bakemonogatari"),
+    # ("Tohru", "miss-kobayashis-dragon-maid"),
+    # ("Holo", "spice-and-wolf"),
+    # ("Power", "chainsaw-man"),
+    ("Shinobu Kocho", "kimetsu-no-yaiba"),
+#     ("Nobara Kugisaki", "jujutsu-kaisen"),
+#     ("Yoruichi Shihōin", "bleach"),
+#     ("Yukino Yukinoshita", "oregairu")
+]
@@ -1,8 +1,9 @@
 import requests
-import os
 from pathlib import Path
 import json
 import time
+from extract.status_journal import StatusJournal, atomic_write, iter_journal
+from placeholders import build_placeholders, safe_image_name
 
 # Character image URLs (using more reliable sources)
 CHARACTER_IMAGES = {
@@ -39,6 +40,9 @@ def create_images_directory():
     images_dir.mkdir(exist_ok=True)
     return images_dir
 
+class DownloadTooSmall(Exception):
+    """Raised inside atomic_write so an undersized download never replaces the target"""
+
 def download_image(url, filename, max_retries=3):
     """Download image from URL with retry logic"""
     for attempt in range(max_retries):
@@ -56,14 +60,18 @@ def download_image(url, filename, max_retries=3):
                 print(f"❌ URL doesn't point to an image: {url}")
                 return False
             
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
-            file_size = os.path.getsize(filename)
-            if file_size < 1024:  # Less than 1KB, probably an error
-                os.remove(filename)
+            # Written to a temp file and renamed on success, so a crash mid-download
+            # never leaves a truncated image that the next run would skip as existing
+            file_size = 0
+            try:
+                with atomic_write(filename, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
+                            file_size += len(chunk)
+                    if file_size < 1024:  # Less than 1KB, probably an error
+                        raise DownloadTooSmall
+            except DownloadTooSmall:
                 print(f"❌ Downloaded file too small: {filename}")
                 return False
                 
@@ -90,78 +98,79 @@ def get_file_extension(url):
     else:
         return '.jpg'  # Default to jpg
 
+def write_download_status(journal_path, status_path, total):
+    """Stream the download journal into download_status.json (written atomically)"""
+    success_count = failed_count = 0
+    with atomic_write(status_path) as f:
+        # downloaded/failed lists are streamed one entry at a time so memory stays flat
+        f.write('{\n  "downloaded": [')
+        for record in iter_journal(journal_path):
+            if record["status"] != "failed":
+                f.write(("," if success_count else "") + "\n    " + json.dumps(record["file"]))
+                success_count += 1
+        f.write('\n  ],\n  "failed": [')
+        for record in iter_journal(journal_path):
+            if record["status"] == "failed":
+                f.write(("," if failed_count else "") + "\n    " + json.dumps(record["character"]))
+                failed_count += 1
+        f.write('\n  ],\n')
+        f.write(f'  "total": {total},\n')
+        f.write(f'  "success_count": {success_count},\n')
+        f.write(f'  "timestamp": {time.time()}\n}}\n')
+    return {"total": total, "success_count": success_count, "failed_count": failed_count}
+
 def fetch_all_images():
     """Download all character images"""
     images_dir = create_images_directory()
-    downloaded = []
-    failed = []
+    journal_path = images_dir / "download_status.jsonl"
     
     print("🎭 Starting character image download...")
     print("=" * 50)
     
-    for character, url in CHARACTER_IMAGES.items():
-        # Clean filename
-        safe_name = "".join(c for c in character if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_name = safe_name.replace(' ', '_')
-        
-        extension = get_file_extension(url)
-        filename = images_dir / f"{safe_name}{extension}"
-        
-        # Skip if already exists
-        if filename.exists():
-            print(f"⏭️  Already exists: {filename}")
-            downloaded.append(str(filename))
-            continue
-        
-        print(f"📥 Downloading {character}...")
-        if download_image(url, filename):
-            downloaded.append(str(filename))
-        else:
-            failed.append(character)
-            print(f"💥 Failed to download: {character}")
-        
-        # Small delay to be nice to servers
-        time.sleep(1)
+    with StatusJournal(journal_path) as journal:
+        for character, url in CHARACTER_IMAGES.items():
+            # Clean filename
+            safe_name = safe_image_name(character)
+            
+            extension = get_file_extension(url)
+            filename = images_dir / f"{safe_name}{extension}"
+            
+            # Skip if already exists
+            if filename.exists():
+                print(f"⏭️  Already exists: {filename}")
+                journal.append({"character": character, "status": "exists", "file": str(filename)})
+                continue
+            
+            print(f"📥 Downloading {character}...")
+            if download_image(url, filename):
+                journal.append({"character": character, "status": "downloaded", "file": str(filename)})
+            else:
+                journal.append({"character": character, "status": "failed", "file": None})
+                print(f"💥 Failed to download: {character}")
+            
+            # Small delay to be nice to servers
+            time.sleep(1)
     
     # Save download status
-    status = {
-        "downloaded": downloaded,
-        "failed": failed,
-        "total": len(CHARACTER_IMAGES),
-        "success_count": len(downloaded),
-        "timestamp": time.time()
-    }
+    status = write_download_status(journal_path, images_dir / "download_status.json", len(CHARACTER_IMAGES))
     
-    with open(images_dir / "download_status.json", 'w') as f:
-        json.dump(status, f, indent=2)
+    # Refresh inline placeholders so downloaded images get blurred thumbnails
+    build_placeholders(CHARACTER_IMAGES)
     
     print("\n" + "=" * 50)
     print(f"🎉 Download complete!")
-    print(f"✅ Successfully downloaded: {len(downloaded)}/{len(CHARACTER_IMAGES)}")
-    print(f"❌ Failed: {len(failed)}")
+    print(f"✅ Successfully downloaded: {status['success_count']}/{status['total']}")
+    print(f"❌ Failed: {status['failed_count']}")
     
-    if failed:
+    if status['failed_count']:
         print("\n💥 Failed downloads:")
-        for character in failed:
-            print(f"   - {character}")
+        for record in iter_journal(journal_path):
+            if record["status"] == "failed":
+                print(f"   - {record['character']}")
     
     print(f"\n📁 Images saved to: {images_dir.absolute()}")
     return status
 
-def get_local_image_path(character_name):
-    """Get local path for character image"""
-    images_dir = Path("images")
-    safe_name = "".join(c for c in character_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    safe_name = safe_name.replace(' ', '_')
-    
-    # Try different extensions
-    for ext in ['.jpg', '.png', '.jpeg', '.webp']:
-        filename = images_dir / f"{safe_name}{ext}"
-        if filename.exists():
-            return str(filename)
-    
-    return None
-
 if __name__ == "__main__":
     print("🎭 Character Image Fetcher")
     print("=" * 30)
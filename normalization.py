@@ -0,0 +1,87 @@
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+class TraitBounds(NamedTuple):
+    """Fixed normalization bounds; bump `version` whenever lo/hi change"""
+    version: str
+    lo: float
+    hi: float
+
+# Traits in data.csv are scored on a 0-100 scale
+TRAIT_BOUNDS = TraitBounds("v1-0-100", 0.0, 100.0)
+
+def normalize_traits(values, bounds=TRAIT_BOUNDS):
+    """Map raw trait scores to [-0.5, 0.5] using fixed bounds (out-of-range values are clipped).
+
+    Unlike a min-max fit, a row's normalized values depend only on that row,
+    so adding characters never rescales existing ones.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return (np.clip(values, bounds.lo, bounds.hi) - bounds.lo) / (bounds.hi - bounds.lo) - 0.5
+
+class TraitDelta(NamedTuple):
+    """Rows appended to a NormalizedTraits store, for incremental index updates"""
+    bounds_version: str
+    start: int          # row index of the first new character
+    names: list
+    rows: np.ndarray    # normalized traits, shape (len(names), n_traits)
+
+class NormalizedTraits:
+    """Append-only store of normalized traits with fixed, versioned bounds.
+
+    Rows live in a buffer that grows geometrically, so appending is amortized
+    O(1) per character and never touches existing rows. Subscribers (e.g.
+    scoring kernels) receive a TraitDelta for every append.
+    """
+
+    def __init__(self, trait_cols, bounds=TRAIT_BOUNDS, capacity=64):
+        self.trait_cols = list(trait_cols)
+        self.bounds = bounds
+        self.names = []
+        self._rows = np.empty((capacity, len(self.trait_cols)), dtype=np.float64)
+        self._subscribers = []
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def values(self):
+        """Normalized trait matrix (a view; valid until the next append)"""
+        return self._rows[:len(self.names)]
+
+    def to_frame(self):
+        return pd.DataFrame(self.values.copy(), columns=self.trait_cols)
+
+    def subscribe(self, callback):
+        """Call `callback(delta)` after every append"""
+        self._subscribers.append(callback)
+
+    def append(self, names, raw_rows):
+        """Normalize and append raw trait rows (columns in `trait_cols` order)"""
+        rows = normalize_traits(np.atleast_2d(raw_rows), self.bounds)
+        if len(names) != len(rows):
+            raise ValueError(f"Got {len(names)} names for {len(rows)} trait rows")
+        if rows.shape[1] != len(self.trait_cols):
+            raise ValueError(f"Expected {len(self.trait_cols)} traits, got {rows.shape[1]}")
+
+        start = len(self.names)
+        end = start + len(rows)
+        if end > len(self._rows):
+            grown = np.empty((max(end, 2 * len(self._rows)), len(self.trait_cols)), dtype=np.float64)
+            grown[:start] = self._rows[:start]
+            self._rows = grown
+        self._rows[start:end] = rows
+        self.names.extend(names)
+
+        delta = TraitDelta(self.bounds.version, start, list(names), rows)
+        for callback in self._subscribers:
+            callback(delta)
+        return delta
+
+    @classmethod
+    def from_frame(cls, df, trait_cols, bounds=TRAIT_BOUNDS):
+        store = cls(trait_cols, bounds, capacity=max(len(df), 1))
+        store.append(df['name'].tolist(), df[trait_cols].to_numpy())
+        return store
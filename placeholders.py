@@ -0,0 +1,124 @@
+import base64
+import io
+import json
+from pathlib import Path
+
+from extract.status_journal import atomic_write
+
+IMAGES_DIR = Path("images")
+PLACEHOLDERS_PATH = IMAGES_DIR / "placeholders.json"
+PLACEHOLDER_SIZE = (300, 400)
+THUMBNAIL_WIDTH = 12  # px; scaled up and blurred by the browser
+
+# Fallback colour and label per character (previously via.placeholder.com URLs)
+FALLBACK_COLOURS = {
+    "Asuna Yuuki": ("#FF69B4", "Asuna ⚔️"),
+    "C.C.": ("#9370DB", "C.C. 🔮"),
+    "Emilia": ("#87CEEB", "Emilia ❄️"),
+    "Erza Scarlet": ("#DC143C", "Erza ⚔️"),
+    "Hinata Hyūga": ("#9370DB", "Hinata 👁️"),
+    "Holo": ("#DEB887", "Holo 🐺"),
+    "Kurisu Makise": ("#FF6347", "Kurisu 🧪"),
+    "Mai Sakurajima": ("#FF1493", "Mai 🎭"),
+    "Maki Zenin": ("#228B22", "Maki 👓"),
+    "Marin Kitagawa": ("#FFB6C1", "Marin 👗"),
+    "Mitsuri Kanroji": ("#FF69B4", "Mitsuri 🗾"),
+    "Nezuko Kamado": ("#FF69B4", "Nezuko 🌸"),
+    "Nico Robin": ("#4169E1", "Robin 📚"),
+    "Nobara Kugisaki": ("#FF4500", "Nobara 🔨"),
+    "Power": ("#FF6347", "Power 🩸"),
+    "Rem": ("#87CEEB", "Rem 💙"),
+    "Rias Gremory": ("#DC143C", "Rias 👹"),
+    "Shinobu Kocho": ("#9370DB", "Shinobu 🦋"),
+    "Shinobu Oshino": ("#FFD700", "Shinobu 🍩"),
+    "Tohru": ("#32CD32", "Tohru 🐉"),
+    "Tsunade": ("#228B22", "Tsunade 🎰"),
+    "Yor Forger": ("#DC143C", "Yor 🗡️"),
+    "Yoruichi Shihōin": ("#9370DB", "Yoruichi ⚡"),
+    "Yukino Yukinoshita": ("#87CEEB", "Yukino ❄️"),
+    "Zero Two": ("#FF69B4", "Zero Two 🦄")
+}
+DEFAULT_COLOUR = "#808080"
+
+def safe_image_name(character_name):
+    """File stem used for a character's downloaded image"""
+    safe_name = "".join(c for c in character_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    return safe_name.replace(' ', '_')
+
+def local_image_path(character_name, images_dir=IMAGES_DIR):
+    """Get local path for character image, or None if it hasn't been downloaded"""
+    safe_name = safe_image_name(character_name)
+    for ext in ['.jpg', '.png', '.jpeg', '.webp']:
+        filename = Path(images_dir) / f"{safe_name}{ext}"
+        if filename.exists():
+            return filename
+    return None
+
+def solid_placeholder(character_name):
+    """Inline SVG data URI: fallback colour with the character's label"""
+    colour, label = FALLBACK_COLOURS.get(character_name, (DEFAULT_COLOUR, character_name))
+    width, height = PLACEHOLDER_SIZE
+    label = label.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    svg = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f'<rect width="100%" height="100%" fill="{colour}"/>'
+        f'<text x="50%" y="50%" fill="#FFFFFF" font-family="sans-serif" font-size="28" '
+        f'text-anchor="middle" dominant-baseline="middle">{label}</text></svg>'
+    )
+    return "data:image/svg+xml;base64," + base64.b64encode(svg.encode("utf-8")).decode("ascii")
+
+def blurred_thumbnail(image_path):
+    """Tiny JPEG data URI of a local image (needs Pillow), or None if unavailable"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        with Image.open(image_path) as img:
+            img = img.convert("RGB")
+            height = max(1, round(img.height * THUMBNAIL_WIDTH / img.width))
+            img = img.resize((THUMBNAIL_WIDTH, height))
+            buf = io.BytesIO()
+            img.save(buf, format="JPEG", quality=60)
+    except OSError:
+        return None
+    return "data:image/jpeg;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+def build_placeholders(character_names, out_path=PLACEHOLDERS_PATH, images_dir=IMAGES_DIR):
+    """Pre-render a placeholder for every character and save them as {name: data URI}"""
+    placeholders = {}
+    for name in character_names:
+        image_path = local_image_path(name, images_dir)
+        placeholders[name] = (image_path and blurred_thumbnail(image_path)) or solid_placeholder(name)
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_write(out_path, encoding="utf-8") as f:
+        json.dump(placeholders, f, ensure_ascii=False)
+    return placeholders
+
+def load_placeholders(path=PLACEHOLDERS_PATH):
+    """Load prebuilt placeholders, or {} if build_placeholders() hasn't been run"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def placeholder_html(data_uri, width):
+    """<img> tag for an inline placeholder; thumbnails are blurred as they are upscaled"""
+    style = f"width:{width}px;aspect-ratio:{PLACEHOLDER_SIZE[0]}/{PLACEHOLDER_SIZE[1]};object-fit:cover;border-radius:10px;"
+    if data_uri.startswith("data:image/jpeg"):
+        style += "filter:blur(8px);"
+    return f'<img src="{data_uri}" style="{style}">'
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    names = pd.read_csv("./data.csv")['name'].tolist()
+    placeholders = build_placeholders(names)
+    thumbnails = sum(uri.startswith("data:image/jpeg") for uri in placeholders.values())
+    size_kb = PLACEHOLDERS_PATH.stat().st_size / 1024
+    print(f"✅ Built {len(placeholders)} placeholders ({thumbnails} blurred thumbnails, "
+          f"{len(placeholders) - thumbnails} solid colour), {size_kb:.1f}KB")
+    print(f"📁 Saved to: {PLACEHOLDERS_PATH.absolute()}")
@@ -0,0 +1,50 @@
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+DISPLAY_COLUMNS = {
+    'rank': 'Rank',
+    'name': 'Character',
+    'match_percentage': 'Match %',
+    'percentile': 'Percentile',
+    'match_score': 'Score',
+}
+
+@lru_cache(maxsize=32)
+def rank_tables(total_chars):
+    """Precomputed (match_percentage, percentile) arrays indexed by rank position.
+
+    Match % is position-based: 100% for 1st, decreasing linearly to a floor of
+    20%. Percentile is the share of other characters ranked below. Both depend
+    only on the catalogue size, so they are computed once per size.
+    """
+    positions = np.arange(total_chars, dtype=np.float64)
+    denom = max(total_chars - 1, 1)
+    match_percentage = np.maximum(20, 100 - positions * (80 / denom))
+    percentile = 100 * (total_chars - 1 - positions) / denom
+    match_percentage.flags.writeable = False
+    percentile.flags.writeable = False
+    return match_percentage, percentile
+
+def format_results(names, summaries, match_scores):
+    """Rank characters by match score and attach display columns in one pass"""
+    match_scores = np.asarray(match_scores)
+    order = np.argsort(-match_scores, kind='stable')
+    match_percentage, percentile = rank_tables(len(match_scores))
+    return pd.DataFrame({
+        'rank': np.arange(1, len(order) + 1),
+        'name': np.asarray(names)[order],
+        'summary': np.asarray(summaries)[order],
+        'match_score': match_scores[order],
+        'match_percentage': match_percentage,
+        'percentile': percentile,
+    })
+
+def page_count(results, page_size):
+    return max(1, -(-len(results) // page_size))
+
+def results_page(results, page, page_size):
+    """Slice one page (1-based) of results, renamed for table display"""
+    start = (page - 1) * page_size
+    return results.iloc[start:start + page_size][list(DISPLAY_COLUMNS)].rename(columns=DISPLAY_COLUMNS)
@@ -0,0 +1,165 @@
+# Scenarios shown by streamlit_app.py and replayed by simulate.py.
+# Each option adds its trait vector (scaled by answer strength) to the user's preferences.
+SCENARIOS = [
+    # Adventure & Comedy scenarios
+    {
+        "scenario_question": "🎮 Your crush challenges you to a video game tournament. Your partner:",
+        "option_a": "Accepts immediately and starts trash-talking playfully",
+        "option_b": "Studies your gaming habits for weeks before accepting",
+        "vector_a": {"Combat Prowess": 1.8, "Impulsiveness": 2.2, "Self-Esteem": 1.7},
+        "vector_b": {"Intellect": 2.1, "Discipline": 1.8, "Cynicism": 1.2}
+    },
+    # Social & Dating scenarios  
+    {
+        "scenario_question": "💕 On your first date at a fancy restaurant, your partner:",
+        "option_a": "Orders the most expensive thing and winks at you",
+        "option_b": "Nervously asks what you're ordering first",
+        "vector_a": {"Social Acuity": 2.3, "Self-Esteem": 2.0, "Assertiveness": 1.6},
+        "vector_b": {"Empathy": 1.9, "Emotional Stability": -0.8, "Nurturance": 1.4}
+    },
+    # Funny Situation scenarios
+    {
+        "scenario_question": " You both get caught in the rain without umbrellas. Your partner:",
+        "option_a": "Starts dancing in the rain like it's a music video",
+        "option_b": "Calculates the exact angle to minimize wetness",
+        "vector_a": {"Optimism": 2.4, "Impulsiveness": 1.9, "Social Acuity": 1.5},
+        "vector_b": {"Intellect": 2.2, "Discipline": 1.6, "Emotional Stability": 1.3}
+    },
+    # Creative & Romantic scenarios
+    {
+        "scenario_question": "🎨 For your anniversary, your partner decides to:",
+        "option_a": "Write you a dramatic love song and perform it publicly",
+        "option_b": "Create a detailed scrapbook of all your memories together",
+        "vector_a": {"Empathy": 2.1, "Impulsiveness": 1.7, "Self-Esteem": 1.8},
+        "vector_b": {"Nurturance": 2.3, "Discipline": 1.9, "Perseverance": 1.5}
+    },
+    # Competition & Fun scenarios
+    {
+        "scenario_question": "🏃‍♀️ During a friendly race in the park, your partner:",
+        "option_a": "Sprints ahead yelling 'Can't catch me!' like a kid",
+        "option_b": "Maintains perfect form and pacing like an athlete",
+        "vector_a": {"Optimism": 2.0, "Impulsiveness": 2.1, "Social Acuity": 1.4},
+        "vector_b": {"Discipline": 2.2, "Ambition": 1.7, "Perseverance": 1.6}
+    },
+    # Food & Lifestyle scenarios
+    {
+        "scenario_question": "🍕 At 2 AM, you're both craving pizza. Your partner:",
+        "option_a": "Already has three delivery apps open and credit card ready",
+        "option_b": "Suggests making homemade pizza because it's healthier",
+        "vector_a": {"Impulsiveness": 2.3, "Optimism": 1.8, "Adaptability": 1.5},
+        "vector_b": {"Discipline": 2.0, "Intellect": 1.6, "Nurturance": 1.4}
+    },
+    # Mystery & Adventure scenarios
+    {
+        "scenario_question": "🕵️ You find a mysterious locked box in the attic. Your partner:",
+        "option_a": "Immediately starts picking the lock with a hairpin",
+        "option_b": "Researches the box's history before touching it",
+        "vector_a": {"Ambition": 2.1, "Impulsiveness": 2.4, "Combat Prowess": 1.3},
+        "vector_b": {"Intellect": 2.3, "Discipline": 1.8, "Emotional Stability": 1.2}
+    },
+    # Emotional & Sweet scenarios
+    {
+        "scenario_question": "😢 You're having a terrible day and feel like crying. Your partner:",
+        "option_a": "Brings ice cream and bad movies for a cuddle session",
+        "option_b": "Gives you space but leaves encouraging notes everywhere",
+        "vector_a": {"Empathy": 2.4, "Nurturance": 2.2, "Social Acuity": 1.6},
+        "vector_b": {"Independence": 1.8, "Nurturance": 2.0, "Discipline": 1.5}
+    },
+    # Leadership & Social scenarios
+    {
+        "scenario_question": "🎉 Planning a surprise party for a friend, your partner:",
+        "option_a": "Takes charge and assigns everyone specific tasks",
+        "option_b": "Quietly handles all the details behind the scenes",
+        "vector_a": {"Assertiveness": 2.3, "Social Acuity": 2.0, "Ambition": 1.7},
+        "vector_b": {"Nurturance": 2.2, "Discipline": 1.9, "Altruism": 1.8}
+    },
+    # Drama & Conflict scenarios
+    {
+        "scenario_question": "💢 Your friend starts spreading rumors about you. Your partner:",
+        "option_a": "Confronts them directly at lunch in front of everyone",
+        "option_b": "Quietly gathers evidence and plans the perfect comeback",
+        "vector_a": {"Assertiveness": 2.4, "Impulsiveness": 2.0, "Loyalty": 1.9},
+        "vector_b": {"Intellect": 2.1, "Cynicism": 1.8, "Discipline": 1.7}
+    },
+    # Romance & Flirting scenarios
+    {
+        "scenario_question": "😏 When you compliment their new haircut, your partner:",
+        "option_a": "Blushes adorably and does a little hair flip",
+        "option_b": "Smirks confidently and says 'I know, right?'",
+        "vector_a": {"Empathy": 1.6, "Self-Esteem": -0.5, "Nurturance": 1.3},
+        "vector_b": {"Self-Esteem": 2.2, "Assertiveness": 1.8, "Social Acuity": 1.5}
+    },
+    # Adventure & Spontaneity scenarios
+    {
+        "scenario_question": "🎢 At an amusement park, your partner wants to:",
+        "option_a": "Ride the scariest roller coaster five times in a row",
+        "option_b": "Win you the biggest stuffed animal from the ring toss",
+        "vector_a": {"Combat Prowess": 2.0, "Impulsiveness": 2.2, "Resilience": 1.8},
+        "vector_b": {"Nurturance": 2.1, "Perseverance": 2.0, "Ambition": 1.4}
+    },
+    # Technology & Modern Life scenarios
+    {
+        "scenario_question": "📱 Your phone dies during a date. Your partner:",
+        "option_a": "Says 'Perfect! Now we can actually talk to each other'",
+        "option_b": "Immediately offers their portable charger",
+        "vector_a": {"Independence": 2.0, "Social Acuity": 1.8, "Optimism": 1.6},
+        "vector_b": {"Nurturance": 2.3, "Empathy": 1.9, "Discipline": 1.4}
+    },
+    # Shopping & Lifestyle scenarios  
+    {
+        "scenario_question": " During a shopping trip, your partner:",
+        "option_a": "Tries on ridiculous outfits to make you laugh",
+        "option_b": "Carefully compares prices and reads all the reviews",
+        "vector_a": {"Optimism": 2.2, "Social Acuity": 1.9, "Impulsiveness": 1.6},
+        "vector_b": {"Intellect": 2.1, "Discipline": 2.0, "Emotional Stability": 1.5}
+    },
+    # Study & School scenarios
+    {
+        "scenario_question": "📚 Before a big exam, your partner:",
+        "option_a": "Stays up all night cramming with energy drinks",
+        "option_b": "Has been studying consistently for weeks with a schedule",
+        "vector_a": {"Impulsiveness": 2.3, "Resilience": 1.8, "Ambition": 1.6},
+        "vector_b": {"Discipline": 2.4, "Intellect": 2.0, "Perseverance": 2.1}
+    },
+    # Family & Friends scenarios
+    {
+        "scenario_question": "👨‍👩‍👧‍👦 Meeting your parents for the first time, your partner:",
+        "option_a": "Brings homemade cookies and compliments everything",
+        "option_b": "Researches your family's interests and asks thoughtful questions",
+        "vector_a": {"Nurturance": 2.2, "Social Acuity": 2.0, "Empathy": 1.8},
+        "vector_b": {"Intellect": 2.1, "Discipline": 1.9, "Adaptability": 1.7}
+    },
+    # Pets & Animals scenarios
+    {
+        "scenario_question": "🐱 A stray kitten follows you both home. Your partner:",
+        "option_a": "Already has it named and is googling pet stores",
+        "option_b": "Wants to find its owner or a proper shelter first",
+        "vector_a": {"Impulsiveness": 2.4, "Nurturance": 2.3, "Optimism": 1.9},
+        "vector_b": {"Discipline": 2.0, "Altruism": 2.1, "Intellect": 1.6}
+    },
+    # Weather & Seasons scenarios
+    {
+        "scenario_question": "❄️ On the first snow day, your partner:",
+        "option_a": "Immediately starts a snowball fight",
+        "option_b": "Makes hot chocolate and suggests staying cozy inside",
+        "vector_a": {"Optimism": 2.3, "Impulsiveness": 2.1, "Combat Prowess": 1.5},
+        "vector_b": {"Nurturance": 2.2, "Emotional Stability": 1.8, "Empathy": 1.6}
+    },
+    # Dreams & Goals scenarios
+    {
+        "scenario_question": "⭐ When you mention your crazy dream career, your partner:",
+        "option_a": "Gets super excited and starts planning how to make it happen",
+        "option_b": "Listens carefully and asks about backup plans too",
+        "vector_a": {"Optimism": 2.4, "Ambition": 2.1, "Impulsiveness": 1.7},
+        "vector_b": {"Intellect": 2.0, "Emotional Stability": 1.8, "Discipline": 1.6}
+    },
+    # Time & Punctuality scenarios
+    {
+        "scenario_question": "⏰ You're running late for movie night. Your partner:",
+        "option_a": "Says 'Fashionably late is the best kind of late!'",
+        "option_b": "Has already called ahead to change the showtime",
+        "vector_a": {"Adaptability": 2.2, "Optimism": 1.9, "Independence": 1.5},
+        "vector_b": {"Discipline": 2.3, "Intellect": 1.8, "Nurturance": 1.7}
+    }
+    
+]
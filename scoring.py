@@ -0,0 +1,198 @@
+import numpy as np
+
+from normalization import TRAIT_BOUNDS
+
+class Kernel:
+    """Scoring kernel reduced to `scores = matrix @ prepare(preferences) + bias`.
+
+    fit() does all per-character work (norms, covariance factors, weights) once
+    at load time, so scoring a request is a single matrix-vector product plus
+    O(n_traits) work on the preference vector. Scores are only meaningful
+    relative to each other: terms that are constant across characters are dropped.
+
+    apply_delta() only computes rows for newly appended characters, writing
+    them into a geometrically grown buffer, so existing rows are never
+    recomputed or rebuilt. Kernels with catalogue-wide statistics (covariance,
+    trait weights) keep their fit-time values; `stale_rows` counts rows added
+    since, and needs_refit() says when fit() should be re-run.
+
+    Readers see the rows through one (matrix, bias) snapshot that fit() and
+    apply_delta() replace in a single assignment, so score() never mixes the
+    rows of two versions. Writers (fit/apply_delta) must not run concurrently.
+    """
+    name = None
+    label = None
+    uses_catalogue_stats = False
+
+    def fit(self, traits, bounds_version=TRAIT_BOUNDS.version):
+        traits = np.asarray(traits, dtype=np.float64)
+        self.bounds_version = bounds_version
+        self._fit_params(traits)
+        matrix, bias = self._rows(traits)
+        self._n = len(matrix)
+        self._matrix_buf = matrix
+        self._bias_buf = bias
+        self.fitted_rows = self._n
+        self.stale_rows = 0
+        self._snapshot = (matrix, bias)
+        return self
+
+    @property
+    def matrix(self):
+        return self._snapshot[0]
+
+    @property
+    def bias(self):
+        return self._snapshot[1]
+
+    def apply_delta(self, delta):
+        """Append rows for characters added to a NormalizedTraits store"""
+        if delta.bounds_version != self.bounds_version:
+            raise ValueError(f"Delta uses trait bounds {delta.bounds_version!r}, "
+                             f"kernel was fitted under {self.bounds_version!r}")
+        if delta.start != self._n:
+            raise ValueError(f"Delta starts at row {delta.start}, kernel has {self._n} rows")
+        matrix, bias = self._rows(np.asarray(delta.rows, dtype=np.float64))
+        end = self._n + len(matrix)
+        if end > len(self._matrix_buf):
+            capacity = max(end, 2 * len(self._matrix_buf))
+            self._matrix_buf = self._grow(self._matrix_buf, capacity)
+            if self._bias_buf is not None:
+                self._bias_buf = self._grow(self._bias_buf, capacity)
+        self._matrix_buf[self._n:end] = matrix
+        if bias is not None:
+            self._bias_buf[self._n:end] = bias
+        self._n = end
+        # Rows below the old end are never written, so earlier snapshots stay valid
+        self._snapshot = (self._matrix_buf[:end], None if bias is None else self._bias_buf[:end])
+        if self.uses_catalogue_stats:
+            self.stale_rows += len(matrix)
+
+    def needs_refit(self, tolerance=0.0):
+        """True once appended rows exceed `tolerance` x the rows the statistics were fitted on"""
+        return self.stale_rows > tolerance * self.fitted_rows
+
+    @staticmethod
+    def _grow(buf, capacity):
+        grown = np.empty((capacity,) + buf.shape[1:], dtype=buf.dtype)
+        grown[:len(buf)] = buf
+        return grown
+
+    def _fit_params(self, traits):
+        pass
+
+    def _rows(self, traits):
+        """Per-character (matrix rows, bias or None) given the fitted parameters"""
+        raise NotImplementedError
+
+    def prepare(self, preferences):
+        return preferences
+
+    def score(self, preferences):
+        """Score one preference vector (n_traits,) or a batch (n_sessions, n_traits)"""
+        matrix, bias = self._snapshot
+        scores = self.prepare(np.asarray(preferences, dtype=np.float64)) @ matrix.T
+        if bias is not None:
+            scores += bias
+        return scores
+
+def ideal_point(preferences):
+    """Map summed preference vector(s) into normalized trait space ([-0.5, 0.5])"""
+    peak = np.abs(preferences).max(axis=-1, keepdims=True)
+    return np.divide(0.5 * preferences, peak, out=np.zeros_like(preferences), where=peak > 0)
+
+class DotKernel(Kernel):
+    """Raw dot product of normalized traits with preferences (the original metric)"""
+    name = "dot"
+    label = "Dot product"
+
+    def _rows(self, traits):
+        return traits, None
+
+class CosineKernel(Kernel):
+    """Cosine similarity: ignores how extreme a character is, only their direction"""
+    name = "cosine"
+    label = "Cosine similarity"
+
+    def _rows(self, traits):
+        norms = np.linalg.norm(traits, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return traits / norms, None
+
+    def prepare(self, preferences):
+        norm = np.linalg.norm(preferences, axis=-1, keepdims=True)
+        return np.divide(preferences, norm, out=np.zeros_like(preferences), where=norm > 0)
+
+class WeightedKernel(Kernel):
+    """Trait-weighted dot product; defaults to inverse standard deviation per trait"""
+    name = "weighted"
+    label = "Trait-weighted"
+    uses_catalogue_stats = True
+
+    def __init__(self, weights=None):
+        self.weights = weights
+
+    def _fit_params(self, traits):
+        weights = self.weights
+        if weights is None:
+            std = traits.std(axis=0)
+            std[std == 0] = 1.0
+            weights = 1.0 / std
+            weights /= weights.mean()
+        self.trait_weights = np.asarray(weights, dtype=np.float64)
+
+    def _rows(self, traits):
+        return traits * self.trait_weights, None
+
+class EuclideanKernel(Kernel):
+    """Negative squared distance to the ideal point: -||t - x||² = 2t·x - ||t||² (+ const)"""
+    name = "euclidean"
+    label = "Euclidean distance"
+
+    def _rows(self, traits):
+        return 2 * traits, -np.einsum('ij,ij->i', traits, traits)
+
+    def prepare(self, preferences):
+        return ideal_point(preferences)
+
+class MahalanobisKernel(Kernel):
+    """Negative squared Mahalanobis distance to the ideal point under the trait covariance"""
+    name = "mahalanobis"
+    label = "Mahalanobis distance"
+    uses_catalogue_stats = True
+
+    def __init__(self, ridge=1e-3):
+        self.ridge = ridge
+
+    def _fit_params(self, traits):
+        cov = np.cov(traits, rowvar=False) if len(traits) > 1 else np.zeros((traits.shape[1],) * 2)
+        cov = np.atleast_2d(cov) + self.ridge * np.eye(traits.shape[1])
+        # Cholesky factor once at load: S⁻¹ t = L⁻ᵀ L⁻¹ t
+        self.chol = np.linalg.cholesky(cov)
+        self.precision = np.linalg.solve(self.chol.T, np.linalg.solve(self.chol, np.eye(len(cov))))
+
+    def _rows(self, traits):
+        whitened = np.linalg.solve(self.chol, traits.T).T     # L⁻¹ t per row
+        # -(t-x)ᵀS⁻¹(t-x) = 2(S⁻¹t)·x - tᵀS⁻¹t (+ const)
+        return 2 * (traits @ self.precision), -np.einsum('ij,ij->i', whitened, whitened)
+
+    def prepare(self, preferences):
+        return ideal_point(preferences)
+
+KERNELS = {
+    kernel.name: kernel
+    for kernel in (DotKernel, CosineKernel, WeightedKernel, EuclideanKernel, MahalanobisKernel)
+}
+
+DEFAULT_KERNEL = "dot"
+
+def fit_kernels(traits, names=None, bounds_version=TRAIT_BOUNDS.version):
+    """Fit every registered kernel (or just `names`) against the trait matrix"""
+    return {name: KERNELS[name]().fit(traits, bounds_version) for name in (names or KERNELS)}
+
+def refit_stale(kernels, traits, tolerance=0.0):
+    """Re-fit kernels whose catalogue statistics drifted after appends; returns their names"""
+    stale = [name for name, kernel in kernels.items() if kernel.needs_refit(tolerance)]
+    for name in stale:
+        kernels[name].fit(traits, kernels[name].bounds_version)
+    return stale
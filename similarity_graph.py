@@ -0,0 +1,220 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from normalization import TRAIT_BOUNDS, normalize_traits
+
+DATA_PATH = "./data.csv"
+GRAPH_PATH = Path("similarity_graph.npz")
+DEFAULT_K = 5
+
+def load_traits(data_path=DATA_PATH):
+    """Load character names and the normalized trait matrix used by the app"""
+    df = pd.read_csv(data_path)
+    trait_cols = df.select_dtypes(include=np.number).columns.tolist()
+
+    # Same fixed-bounds normalization as load_data() in streamlit_app.py
+    traits_norm = normalize_traits(df[trait_cols].to_numpy()).astype(np.float32)
+    return df['name'].to_numpy(dtype=str), traits_norm
+
+class SimilarityGraph:
+    """k-nearest-neighbour graph stored in CSR form (indptr, indices, data)"""
+
+    def __init__(self, indptr, indices, data, names=None, bounds_version=TRAIT_BOUNDS.version):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.names = names
+        self.bounds_version = bounds_version
+        self._name_to_row = None
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @property
+    def width(self):
+        """Neighbours per row (every row has the same number)"""
+        return int(self.indptr[1] - self.indptr[0]) if len(self) else 0
+
+    def neighbours(self, row):
+        """Return (neighbour rows, similarities) for a character row in O(1)"""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def neighbours_by_name(self, name):
+        """Return [(name, similarity), ...] for a character name, or [] if unknown"""
+        if self.names is None:
+            return []
+        if self._name_to_row is None:
+            self._name_to_row = {n: i for i, n in enumerate(self.names)}
+        row = self._name_to_row.get(name)
+        if row is None:
+            return []
+        rows, sims = self.neighbours(row)
+        return [(str(self.names[r]), float(s)) for r, s in zip(rows, sims)]
+
+    def with_delta(self, delta, traits, k=None):
+        """New graph with k-NN rows spliced in for a NormalizedTraits delta; `traits` is the store's full matrix"""
+        if delta.bounds_version != self.bounds_version:
+            raise ValueError(f"Delta uses trait bounds {delta.bounds_version!r}, "
+                             f"graph was built under {self.bounds_version!r}")
+        if delta.start != len(self):
+            raise ValueError(f"Delta starts at row {delta.start}, graph has {len(self)} rows")
+        names = None if self.names is None else np.concatenate([self.names, np.asarray(delta.names, dtype=str)])
+        return extend_knn_graph(self, traits, k or max(self.width, DEFAULT_K), names=names)
+
+    def apply_delta(self, delta, traits, k=None):
+        """In-place with_delta(), for a graph no other thread is reading"""
+        grown = self.with_delta(delta, traits, k)
+        self.indptr, self.indices, self.data, self.names = grown.indptr, grown.indices, grown.data, grown.names
+        self._name_to_row = None
+
+    def save(self, path=GRAPH_PATH):
+        """Save graph arrays (and names, if known) to an .npz file"""
+        arrays = {"indptr": self.indptr, "indices": self.indices, "data": self.data,
+                  "bounds_version": np.array(self.bounds_version)}
+        if self.names is not None:
+            arrays["names"] = self.names
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path=GRAPH_PATH):
+        """Load a graph written by save()"""
+        with np.load(path, allow_pickle=False) as npz:
+            names = npz["names"] if "names" in npz.files else None
+            bounds_version = str(npz["bounds_version"]) if "bounds_version" in npz.files else None
+            return cls(npz["indptr"], npz["indices"], npz["data"], names, bounds_version)
+
+def _unit_rows(traits):
+    """Scale rows to unit length so a dot product is cosine similarity"""
+    norms = np.linalg.norm(traits, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (traits / norms).astype(np.float32, copy=False)
+
+def _merge_topk(best_sim, best_idx, cand_sim, cand_idx, k):
+    """Keep the k largest similarities per row out of two candidate sets"""
+    sims = np.concatenate([best_sim, cand_sim], axis=1)
+    idx = np.concatenate([best_idx, cand_idx], axis=1)
+    top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(sims, top, axis=1), np.take_along_axis(idx, top, axis=1)
+
+def _merge_corpus(unit, q0, q1, c_start, c_end, best_sim, best_idx, corpus_block):
+    """Merge candidates from corpus rows [c_start, c_end) into the top-k of query rows [q0, q1)"""
+    k = best_sim.shape[1]
+    query = unit[q0:q1]
+    rows = np.arange(q1 - q0)
+    for c0 in range(c_start, c_end, corpus_block):
+        c1 = min(c0 + corpus_block, c_end)
+        sims = query @ unit[c0:c1].T
+
+        # A character is never its own neighbour
+        self_cols = np.arange(q0, q1) - c0
+        in_tile = (self_cols >= 0) & (self_cols < c1 - c0)
+        sims[rows[in_tile], self_cols[in_tile]] = -np.inf
+
+        # Reduce the tile to its own top-k before merging
+        tile_k = min(k, c1 - c0)
+        top = np.argpartition(-sims, tile_k - 1, axis=1)[:, :tile_k]
+        tile_sim = np.take_along_axis(sims, top, axis=1)
+        best_sim, best_idx = _merge_topk(best_sim, best_idx, tile_sim,
+                                         (top + c0).astype(np.int32), k)
+
+    order = np.argsort(-best_sim, axis=1)
+    return np.take_along_axis(best_sim, order, axis=1), np.take_along_axis(best_idx, order, axis=1)
+
+def build_knn_graph(traits, k=DEFAULT_K, query_block=1024, corpus_block=16384, names=None,
+                    bounds_version=TRAIT_BOUNDS.version):
+    """Build a cosine k-NN graph with blocked matrix multiplication.
+
+    Only a (query_block x corpus_block) similarity tile is held at once, so
+    peak memory is bounded by the block sizes plus the n*k output arrays
+    (about 80MB for 1M characters at k=10) rather than by n².
+    """
+    unit = _unit_rows(np.asarray(traits, dtype=np.float32))
+    n = len(unit)
+    k = min(k, n - 1)
+    if k <= 0:
+        return SimilarityGraph(np.zeros(n + 1, dtype=np.int64),
+                               np.empty(0, dtype=np.int32),
+                               np.empty(0, dtype=np.float32), names, bounds_version)
+
+    indices = np.empty((n, k), dtype=np.int32)
+    data = np.empty((n, k), dtype=np.float32)
+
+    for q0 in range(0, n, query_block):
+        q1 = min(q0 + query_block, n)
+        best_sim = np.full((q1 - q0, k), -np.inf, dtype=np.float32)
+        best_idx = np.full((q1 - q0, k), -1, dtype=np.int32)
+        data[q0:q1], indices[q0:q1] = _merge_corpus(unit, q0, q1, 0, n, best_sim, best_idx, corpus_block)
+
+    indptr = np.arange(0, n * k + 1, k, dtype=np.int64)
+    return SimilarityGraph(indptr, indices.ravel(), data.ravel(), names, bounds_version)
+
+def extend_knn_graph(graph, traits, k=DEFAULT_K, query_block=1024, corpus_block=16384, names=None):
+    """Add k-NN rows for characters appended after `graph` was built.
+
+    `traits` holds every character, old rows first. New rows are searched
+    against the whole catalogue, and old rows only against the new rows, so
+    the cost is O(n_new * n) instead of the O(n²) of a rebuild. Falls back to
+    a full rebuild while the catalogue is too small to fill k neighbours.
+    """
+    unit = _unit_rows(np.asarray(traits, dtype=np.float32))
+    n, n_old = len(unit), len(graph)
+    width = graph.width
+    if n_old == 0 or width != k or width != min(k, n_old - 1):
+        return build_knn_graph(traits, k, query_block, corpus_block, names, graph.bounds_version)
+
+    data = np.empty((n, k), dtype=np.float32)
+    indices = np.empty((n, k), dtype=np.int32)
+    data[:n_old] = graph.data.reshape(n_old, k)
+    indices[:n_old] = graph.indices.reshape(n_old, k)
+
+    # Existing rows: a new character may displace one of their neighbours
+    for q0 in range(0, n_old, query_block):
+        q1 = min(q0 + query_block, n_old)
+        data[q0:q1], indices[q0:q1] = _merge_corpus(unit, q0, q1, n_old, n, data[q0:q1],
+                                                    indices[q0:q1], corpus_block)
+
+    # New rows: full search over the catalogue
+    for q0 in range(n_old, n, query_block):
+        q1 = min(q0 + query_block, n)
+        best_sim = np.full((q1 - q0, k), -np.inf, dtype=np.float32)
+        best_idx = np.full((q1 - q0, k), -1, dtype=np.int32)
+        data[q0:q1], indices[q0:q1] = _merge_corpus(unit, q0, q1, 0, n, best_sim, best_idx, corpus_block)
+
+    indptr = np.arange(0, n * k + 1, k, dtype=np.int64)
+    return SimilarityGraph(indptr, indices.ravel(), data.ravel(), names, graph.bounds_version)
+
+def load_saved_graph(names, path=GRAPH_PATH):
+    """Saved graph if it was built under the current bounds from a prefix of `names`, else None"""
+    if not Path(path).exists():
+        return None
+    graph = SimilarityGraph.load(path)
+    if (graph.bounds_version != TRAIT_BOUNDS.version or graph.names is None
+            or len(graph) > len(names) or list(graph.names) != list(names[:len(graph)])):
+        return None
+    return graph
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--rebuild"]
+    k = int(args[0]) if args else DEFAULT_K
+    rebuild = "--rebuild" in sys.argv
+
+    names, traits_norm = load_traits()
+    graph = None if rebuild else load_saved_graph(names)
+    start = time.perf_counter()
+    if graph is not None and graph.width == min(k, len(graph) - 1):
+        # Characters were only appended to data.csv: splice in rows for the new ones
+        print(f"🕸️  Extending similarity graph with {len(names) - len(graph)} new characters...")
+        graph = extend_knn_graph(graph, traits_norm, k=k, names=names)
+    else:
+        print("🕸️  Building character similarity graph...")
+        graph = build_knn_graph(traits_norm, k=k, names=names)
+    elapsed = time.perf_counter() - start
+    graph.save(GRAPH_PATH)
+
+    print(f"✅ {len(graph)} characters, k={k}, built in {elapsed:.2f}s")
+    print(f"📁 Graph saved to: {GRAPH_PATH.absolute()}")
@@ -0,0 +1,154 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from normalization import normalize_traits
+from scenarios import SCENARIOS
+from scoring import KERNELS, DEFAULT_KERNEL
+
+DATA_PATH = "./data.csv"
+
+# Answer codes in button order (strongly A, prefer A, neutral, prefer B, strongly B)
+# and the multiplier each one applies to vector_a / vector_b, as in streamlit_app.py
+CHOICE_WEIGHTS_A = np.array([1.0, 0.5, 0.0, 0.0, 0.0], dtype=np.float32)
+CHOICE_WEIGHTS_B = np.array([0.0, 0.0, 0.0, 0.5, 1.0], dtype=np.float32)
+N_CHOICES = len(CHOICE_WEIGHTS_A)
+
+def scenario_matrices(scenarios, trait_cols):
+    """Stack each scenario's vector_a / vector_b into (n_scenarios, n_traits) matrices"""
+    col_index = {trait: j for j, trait in enumerate(trait_cols)}
+    vectors_a = np.zeros((len(scenarios), len(trait_cols)), dtype=np.float32)
+    vectors_b = np.zeros_like(vectors_a)
+    for i, scenario in enumerate(scenarios):
+        for matrix, key in ((vectors_a, "vector_a"), (vectors_b, "vector_b")):
+            for trait, score in scenario[key].items():
+                if trait in col_index:
+                    matrix[i, col_index[trait]] = score
+    return vectors_a, vectors_b
+
+def preferences_from_answers(codes, vectors_a, vectors_b):
+    """Summed preference vectors for a batch of answer sheets (n_sessions, n_scenarios)"""
+    return CHOICE_WEIGHTS_A[codes] @ vectors_a + CHOICE_WEIGHTS_B[codes] @ vectors_b
+
+def perturb_answers(codes, noise, rng):
+    """Move each answer one step left/right with total probability `noise`.
+
+    A step off either end is reflected back inwards, so answers at the
+    extremes move with the same probability as any other.
+    """
+    step = rng.choice(np.array([-1, 0, 1], dtype=np.int8), size=codes.shape,
+                      p=[noise / 2, 1 - noise, noise / 2])
+    moved = codes + step
+    moved[moved < 0] = 1
+    moved[moved > N_CHOICES - 1] = N_CHOICES - 2
+    return moved.astype(np.int8)
+
+# Per-process state set once by _init_worker, so each chunk only ships a seed
+_worker = {}
+
+def _init_worker(vectors_a, vectors_b, kernel, answer_probs, noise):
+    _worker.update(vectors_a=vectors_a, vectors_b=vectors_b, kernel=kernel,
+                   answer_probs=answer_probs, noise=noise)
+
+def _simulate_chunk(args):
+    """Simulate one chunk; returns (#1 counts, noisy #1 agreements, sum of #1 rank shifts)"""
+    n_sessions, seed = args
+    w = _worker
+    rng = np.random.default_rng(seed)
+    n_scenarios, n_chars = len(w["vectors_a"]), len(w["kernel"].matrix)
+
+    codes = rng.choice(np.arange(N_CHOICES, dtype=np.int8), size=(n_sessions, n_scenarios), p=w["answer_probs"])
+    scores = w["kernel"].score(preferences_from_answers(codes, w["vectors_a"], w["vectors_b"]))
+    top = scores.argmax(axis=1)
+    top_counts = np.bincount(top, minlength=n_chars)
+
+    noisy_codes = perturb_answers(codes, w["noise"], rng)
+    noisy_scores = w["kernel"].score(preferences_from_answers(noisy_codes, w["vectors_a"], w["vectors_b"]))
+    agreements = int((noisy_scores.argmax(axis=1) == top).sum())
+    # Rank (0 = #1) of the original top match after the answers were perturbed
+    top_noisy_scores = np.take_along_axis(noisy_scores, top[:, None], axis=1)
+    rank_shift = int((noisy_scores > top_noisy_scores).sum())
+    return top_counts, agreements, rank_shift
+
+def simulate(traits_norm, trait_cols, n_sessions, kernel=DEFAULT_KERNEL, noise=0.1,
+             answer_probs=None, chunk_size=250_000, workers=None, seed=0):
+    """Monte-Carlo answer sheets scored against every character, in parallel chunks.
+
+    Returns a dict with #1-match counts per character, the entropy of the #1
+    distribution and rank stability when answers are nudged by `noise`.
+    """
+    vectors_a, vectors_b = scenario_matrices(SCENARIOS, trait_cols)
+    fitted = KERNELS[kernel]().fit(traits_norm)
+    answer_probs = np.full(N_CHOICES, 1 / N_CHOICES) if answer_probs is None else np.asarray(answer_probs)
+
+    sizes = [min(chunk_size, n_sessions - start) for start in range(0, n_sessions, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    init_args = (vectors_a, vectors_b, fitted, answer_probs, noise)
+    workers = workers or os.cpu_count() or 1
+
+    top_counts = np.zeros(len(fitted.matrix), dtype=np.int64)
+    agreements = rank_shift = 0
+    if workers == 1:
+        _init_worker(*init_args)
+        results = map(_simulate_chunk, zip(sizes, seeds))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args)
+        results = pool.map(_simulate_chunk, zip(sizes, seeds))
+    try:
+        for chunk_counts, chunk_agreements, chunk_shift in results:
+            top_counts += chunk_counts
+            agreements += chunk_agreements
+            rank_shift += chunk_shift
+    finally:
+        if workers != 1:
+            pool.shutdown()
+
+    shares = top_counts / n_sessions
+    nonzero = shares[shares > 0]
+    entropy = float(-(nonzero * np.log2(nonzero)).sum())
+    return {
+        "sessions": n_sessions,
+        "kernel": kernel,
+        "noise": noise,
+        "top_counts": top_counts,
+        "entropy_bits": entropy,
+        "max_entropy_bits": float(np.log2(len(top_counts))),
+        "ever_top": int((top_counts > 0).sum()),
+        "top1_stability": agreements / n_sessions,
+        "mean_rank_shift": rank_shift / n_sessions,
+    }
+
+def load_catalogue(data_path=DATA_PATH):
+    df = pd.read_csv(data_path)
+    trait_cols = df.select_dtypes(include=np.number).columns.tolist()
+    return df['name'].tolist(), normalize_traits(df[trait_cols].to_numpy()), trait_cols
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate answer sheets and report how well scenarios separate characters")
+    parser.add_argument("-n", "--sessions", type=int, default=1_000_000)
+    parser.add_argument("-k", "--kernel", choices=list(KERNELS), default=DEFAULT_KERNEL)
+    parser.add_argument("--noise", type=float, default=0.1, help="chance each answer moves one step")
+    parser.add_argument("-j", "--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    names, traits_norm, trait_cols = load_catalogue()
+    start = time.perf_counter()
+    stats = simulate(traits_norm, trait_cols, args.sessions, kernel=args.kernel, noise=args.noise,
+                     workers=args.workers, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"🎲 Simulated {stats['sessions']:,} sessions ({stats['kernel']} kernel) in {elapsed:.2f}s")
+    print("=" * 50)
+    print(f"📈 Match entropy: {stats['entropy_bits']:.3f} / {stats['max_entropy_bits']:.3f} bits")
+    print(f"🏆 Characters ever ranked #1: {stats['ever_top']}/{len(names)}")
+    print(f"🎯 #1 unchanged under {stats['noise']:.0%} answer noise: {stats['top1_stability']:.1%}")
+    print(f"↕️  Mean rank shift of original #1: {stats['mean_rank_shift']:.2f}")
+    print("\n💕 #1 match share")
+    shares = pd.Series(stats['top_counts'] / stats['sessions'], index=names).sort_values(ascending=False)
+    for name, share in shares.items():
+        print(f"   {name:<25} {share:6.2%}")
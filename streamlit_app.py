@@ -1,10 +1,21 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
+import os
 import random
+import threading
+import time
+import uuid
 import plotly.express as px
 import plotly.graph_objects as go
+from normalization import NormalizedTraits, normalize_traits
+from scenarios import SCENARIOS
+from similarity_graph import extend_knn_graph, load_saved_graph
+from results_formatter import format_results, page_count, results_page
+from scoring import KERNELS, DEFAULT_KERNEL, fit_kernels, refit_stale
+from event_log import EventSink, CHOICE_CODES
+from placeholders import (PLACEHOLDERS_PATH, local_image_path, load_placeholders,
+                          solid_placeholder, placeholder_html)
 
 # Configure the page
 st.set_page_config(
@@ -79,6 +90,14 @@ st.markdown("""
         margin: 0.5rem 0;
         border-left: 4px solid #667eea;
     }
+    /* Portrait cells: the full image is stacked over its placeholder, which stays
+       visible underneath until the browser has finished loading the image */
+    [class*="st-key-portrait-"] {
+        display: grid;
+    }
+    [class*="st-key-portrait-"] > div {
+        grid-area: 1 / 1;
+    }
 </style>
 """, unsafe_allow_html=True)
 
@@ -96,20 +115,37 @@ def initialize_session_state():
         st.session_state.assessment_complete = False
     if 'answer_history' not in st.session_state:
         st.session_state.answer_history = []
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex[:12]
+    if 'started_at' not in st.session_state:
+        st.session_state.started_at = None
+    if 'question_shown_at' not in st.session_state:
+        st.session_state.question_shown_at = None
+    if 'result_logged' not in st.session_state:
+        st.session_state.result_logged = False
 
 def reset_assessment():
     """Reset all session state variables to restart the assessment"""
     keys_to_reset = ['assessment_started', 'current_question', 'user_preferences', 
-                     'scenario_history', 'assessment_complete', 'answer_history']
+                     'scenario_history', 'assessment_complete', 'answer_history',
+                     'session_id', 'started_at', 'question_shown_at', 'result_logged']
     for key in keys_to_reset:
         if key in st.session_state:
             del st.session_state[key]
     initialize_session_state()
 
+DATA_PATH = "./data.csv"
+
+def file_version(path=DATA_PATH):
+    """Modification time of a data file, so cached loaders pick up edits"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
 # Load data
 @st.cache_data
-def load_data():
-    DATA_PATH = "./data.csv"
+def load_data(version=None):
     try:
         df = pd.read_csv(DATA_PATH)
     except FileNotFoundError:
@@ -118,228 +154,100 @@ def load_data():
     
     trait_cols = df.select_dtypes(include=np.number).columns.tolist()
     
-    # Normalize traits
-    scaler = MinMaxScaler()
-    traits_norm = pd.DataFrame(scaler.fit_transform(df[trait_cols]) - 0.5, columns=trait_cols, index=df.index)
+    # Normalize traits against fixed, versioned bounds so new characters never rescale existing ones
+    traits_norm = pd.DataFrame(normalize_traits(df[trait_cols].values), columns=trait_cols, index=df.index)
     
     return df, traits_norm, trait_cols
 
+# Re-fit weighted/Mahalanobis statistics once appends exceed this fraction of the
+# characters they were fitted on (amortized O(1) refits per appended character)
+REFIT_TOLERANCE = 0.1
+
+# Trait store shared by all sessions. Scoring kernels (and the similarity graph,
+# if one was built offline) subscribe to it, so characters appended to data.csv
+# only cost their own rows instead of a refit of everything.
+@st.cache_resource
+def load_match_index(trait_cols):
+    version = file_version()
+    df, _, _ = load_data(version)
+    trait_cols = list(trait_cols)
+    store = NormalizedTraits.from_frame(df, trait_cols)
+    # Fit every scoring kernel once, so switching metrics costs nothing per request
+    kernels = fit_kernels(store.values, bounds_version=store.bounds.version)
+    for kernel in kernels.values():
+        store.subscribe(kernel.apply_delta)
+
+    # A graph saved before characters were appended is extended rather than dropped
+    graph = load_saved_graph(store.names)
+    if graph is not None and len(graph) < len(store):
+        graph = extend_knn_graph(graph, store.values, k=graph.width, names=np.array(store.names))
+    index = {"store": store, "kernels": kernels, "graph": graph, "version": version, "lock": threading.Lock()}
+    if graph is not None:
+        # Other sessions may be reading the graph: swap in a new one instead of mutating it
+        store.subscribe(lambda delta: index.update(graph=index["graph"].with_delta(delta, store.values)))
+    return index
+
+def sync_match_index(df, trait_cols, version):
+    """Bring the shared match index up to date with data.csv (loaded at `version`)"""
+    index = load_match_index(tuple(trait_cols))
+    store = index["store"]
+    with index["lock"]:
+        if index["version"] == version:
+            return index
+        n = len(store)
+        unchanged = (len(df) >= n and store.names == df['name'].iloc[:n].tolist()
+                     and np.array_equal(store.values, normalize_traits(df[trait_cols].iloc[:n].values, store.bounds)))
+        if not unchanged:
+            # Existing rows were edited or removed, not just appended to: start over
+            load_match_index.clear()
+            return load_match_index(tuple(trait_cols))
+        if len(df) > n:
+            new = df.iloc[n:]
+            store.append(new['name'].tolist(), new[trait_cols].to_numpy())
+            refit_stale(index["kernels"], store.values, tolerance=REFIT_TOLERANCE)
+        index["version"] = version
+    return index
+
+# One background event writer shared by all sessions
+@st.cache_resource
+def get_event_sink():
+    return EventSink()
+
 # Load scenario data
 @st.cache_data
 def get_scenarios():
     """Get fun and engaging PG-13 scenarios covering all personality aspects"""
-    return [
-        # Adventure & Comedy scenarios
-        {
-            "scenario_question": "🎮 Your crush challenges you to a video game tournament. Your partner:",
-            "option_a": "Accepts immediately and starts trash-talking playfully",
-            "option_b": "Studies your gaming habits for weeks before accepting",
-            "vector_a": {"Combat Prowess": 1.8, "Impulsiveness": 2.2, "Self-Esteem": 1.7},
-            "vector_b": {"Intellect": 2.1, "Discipline": 1.8, "Cynicism": 1.2}
-        },
-        # Social & Dating scenarios  
-        {
-            "scenario_question": "💕 On your first date at a fancy restaurant, your partner:",
-            "option_a": "Orders the most expensive thing and winks at you",
-            "option_b": "Nervously asks what you're ordering first",
-            "vector_a": {"Social Acuity": 2.3, "Self-Esteem": 2.0, "Assertiveness": 1.6},
-            "vector_b": {"Empathy": 1.9, "Emotional Stability": -0.8, "Nurturance": 1.4}
-        },
-        # Funny Situation scenarios
-        {
-            "scenario_question": " You both get caught in the rain without umbrellas. Your partner:",
-            "option_a": "Starts dancing in the rain like it's a music video",
-            "option_b": "Calculates the exact angle to minimize wetness",
-            "vector_a": {"Optimism": 2.4, "Impulsiveness": 1.9, "Social Acuity": 1.5},
-            "vector_b": {"Intellect": 2.2, "Discipline": 1.6, "Emotional Stability": 1.3}
-        },
-        # Creative & Romantic scenarios
-        {
-            "scenario_question": "🎨 For your anniversary, your partner decides to:",
-            "option_a": "Write you a dramatic love song and perform it publicly",
-            "option_b": "Create a detailed scrapbook of all your memories together",
-            "vector_a": {"Empathy": 2.1, "Impulsiveness": 1.7, "Self-Esteem": 1.8},
-            "vector_b": {"Nurturance": 2.3, "Discipline": 1.9, "Perseverance": 1.5}
-        },
-        # Competition & Fun scenarios
-        {
-            "scenario_question": "🏃‍♀️ During a friendly race in the park, your partner:",
-            "option_a": "Sprints ahead yelling 'Can't catch me!' like a kid",
-            "option_b": "Maintains perfect form and pacing like an athlete",
-            "vector_a": {"Optimism": 2.0, "Impulsiveness": 2.1, "Social Acuity": 1.4},
-            "vector_b": {"Discipline": 2.2, "Ambition": 1.7, "Perseverance": 1.6}
-        },
-        # Food & Lifestyle scenarios
-        {
-            "scenario_question": "🍕 At 2 AM, you're both craving pizza. Your partner:",
-            "option_a": "Already has three delivery apps open and credit card ready",
-            "option_b": "Suggests making homemade pizza because it's healthier",
-            "vector_a": {"Impulsiveness": 2.3, "Optimism": 1.8, "Adaptability": 1.5},
-            "vector_b": {"Discipline": 2.0, "Intellect": 1.6, "Nurturance": 1.4}
-        },
-        # Mystery & Adventure scenarios
-        {
-            "scenario_question": "🕵️ You find a mysterious locked box in the attic. Your partner:",
-            "option_a": "Immediately starts picking the lock with a hairpin",
-            "option_b": "Researches the box's history before touching it",
-            "vector_a": {"Ambition": 2.1, "Impulsiveness": 2.4, "Combat Prowess": 1.3},
-            "vector_b": {"Intellect": 2.3, "Discipline": 1.8, "Emotional Stability": 1.2}
-        },
-        # Emotional & Sweet scenarios
-        {
-            "scenario_question": "😢 You're having a terrible day and feel like crying. Your partner:",
-            "option_a": "Brings ice cream and bad movies for a cuddle session",
-            "option_b": "Gives you space but leaves encouraging notes everywhere",
-            "vector_a": {"Empathy": 2.4, "Nurturance": 2.2, "Social Acuity": 1.6},
-            "vector_b": {"Independence": 1.8, "Nurturance": 2.0, "Discipline": 1.5}
-        },
-        # Leadership & Social scenarios
-        {
-            "scenario_question": "🎉 Planning a surprise party for a friend, your partner:",
-            "option_a": "Takes charge and assigns everyone specific tasks",
-            "option_b": "Quietly handles all the details behind the scenes",
-            "vector_a": {"Assertiveness": 2.3, "Social Acuity": 2.0, "Ambition": 1.7},
-            "vector_b": {"Nurturance": 2.2, "Discipline": 1.9, "Altruism": 1.8}
-        },
-        # Drama & Conflict scenarios
-        {
-            "scenario_question": "💢 Your friend starts spreading rumors about you. Your partner:",
-            "option_a": "Confronts them directly at lunch in front of everyone",
-            "option_b": "Quietly gathers evidence and plans the perfect comeback",
-            "vector_a": {"Assertiveness": 2.4, "Impulsiveness": 2.0, "Loyalty": 1.9},
-            "vector_b": {"Intellect": 2.1, "Cynicism": 1.8, "Discipline": 1.7}
-        },
-        # Romance & Flirting scenarios
-        {
-            "scenario_question": "😏 When you compliment their new haircut, your partner:",
-            "option_a": "Blushes adorably and does a little hair flip",
-            "option_b": "Smirks confidently and says 'I know, right?'",
-            "vector_a": {"Empathy": 1.6, "Self-Esteem": -0.5, "Nurturance": 1.3},
-            "vector_b": {"Self-Esteem": 2.2, "Assertiveness": 1.8, "Social Acuity": 1.5}
-        },
-        # Adventure & Spontaneity scenarios
-        {
-            "scenario_question": "🎢 At an amusement park, your partner wants to:",
-            "option_a": "Ride the scariest roller coaster five times in a row",
-            "option_b": "Win you the biggest stuffed animal from the ring toss",
-            "vector_a": {"Combat Prowess": 2.0, "Impulsiveness": 2.2, "Resilience": 1.8},
-            "vector_b": {"Nurturance": 2.1, "Perseverance": 2.0, "Ambition": 1.4}
-        },
-        # Technology & Modern Life scenarios
-        {
-            "scenario_question": "📱 Your phone dies during a date. Your partner:",
-            "option_a": "Says 'Perfect! Now we can actually talk to each other'",
-            "option_b": "Immediately offers their portable charger",
-            "vector_a": {"Independence": 2.0, "Social Acuity": 1.8, "Optimism": 1.6},
-            "vector_b": {"Nurturance": 2.3, "Empathy": 1.9, "Discipline": 1.4}
-        },
-        # Shopping & Lifestyle scenarios  
-        {
-            "scenario_question": " During a shopping trip, your partner:",
-            "option_a": "Tries on ridiculous outfits to make you laugh",
-            "option_b": "Carefully compares prices and reads all the reviews",
-            "vector_a": {"Optimism": 2.2, "Social Acuity": 1.9, "Impulsiveness": 1.6},
-            "vector_b": {"Intellect": 2.1, "Discipline": 2.0, "Emotional Stability": 1.5}
-        },
-        # Study & School scenarios
-        {
-            "scenario_question": "📚 Before a big exam, your partner:",
-            "option_a": "Stays up all night cramming with energy drinks",
-            "option_b": "Has been studying consistently for weeks with a schedule",
-            "vector_a": {"Impulsiveness": 2.3, "Resilience": 1.8, "Ambition": 1.6},
-            "vector_b": {"Discipline": 2.4, "Intellect": 2.0, "Perseverance": 2.1}
-        },
-        # Family & Friends scenarios
-        {
-            "scenario_question": "👨‍👩‍👧‍👦 Meeting your parents for the first time, your partner:",
-            "option_a": "Brings homemade cookies and compliments everything",
-            "option_b": "Researches your family's interests and asks thoughtful questions",
-            "vector_a": {"Nurturance": 2.2, "Social Acuity": 2.0, "Empathy": 1.8},
-            "vector_b": {"Intellect": 2.1, "Discipline": 1.9, "Adaptability": 1.7}
-        },
-        # Pets & Animals scenarios
-        {
-            "scenario_question": "🐱 A stray kitten follows you both home. Your partner:",
-            "option_a": "Already has it named and is googling pet stores",
-            "option_b": "Wants to find its owner or a proper shelter first",
-            "vector_a": {"Impulsiveness": 2.4, "Nurturance": 2.3, "Optimism": 1.9},
-            "vector_b": {"Discipline": 2.0, "Altruism": 2.1, "Intellect": 1.6}
-        },
-        # Weather & Seasons scenarios
-        {
-            "scenario_question": "❄️ On the first snow day, your partner:",
-            "option_a": "Immediately starts a snowball fight",
-            "option_b": "Makes hot chocolate and suggests staying cozy inside",
-            "vector_a": {"Optimism": 2.3, "Impulsiveness": 2.1, "Combat Prowess": 1.5},
-            "vector_b": {"Nurturance": 2.2, "Emotional Stability": 1.8, "Empathy": 1.6}
-        },
-        # Dreams & Goals scenarios
-        {
-            "scenario_question": "⭐ When you mention your crazy dream career, your partner:",
-            "option_a": "Gets super excited and starts planning how to make it happen",
-            "option_b": "Listens carefully and asks about backup plans too",
-            "vector_a": {"Optimism": 2.4, "Ambition": 2.1, "Impulsiveness": 1.7},
-            "vector_b": {"Intellect": 2.0, "Emotional Stability": 1.8, "Discipline": 1.6}
-        },
-        # Time & Punctuality scenarios
-        {
-            "scenario_question": "⏰ You're running late for movie night. Your partner:",
-            "option_a": "Says 'Fashionably late is the best kind of late!'",
-            "option_b": "Has already called ahead to change the showtime",
-            "vector_a": {"Adaptability": 2.2, "Optimism": 1.9, "Independence": 1.5},
-            "vector_b": {"Discipline": 2.3, "Intellect": 1.8, "Nurturance": 1.7}
-        }
-        
-    ]
+    return SCENARIOS
+
+# Inline placeholders, pre-rendered by placeholders.py
+@st.cache_data
+def get_placeholders(data_version=None, placeholders_version=None):
+    df, _, _ = load_data(data_version)
+    placeholders = load_placeholders()
+    # Characters added since the last build still get a local placeholder
+    for name in df['name']:
+        if name not in placeholders:
+            placeholders[name] = solid_placeholder(name)
+    return placeholders
 
 def get_character_image(character_name):
-    """Get local character image path or fallback to placeholder"""
-    from pathlib import Path
-    
-    images_dir = Path("images")
-    safe_name = "".join(c for c in character_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    safe_name = safe_name.replace(' ', '_')
-    
-    # Try different extensions
-    for ext in ['.jpg', '.png', '.jpeg', '.webp']:
-        filename = images_dir / f"{safe_name}{ext}"
-        if filename.exists():
-            return str(filename)
-    
-    # Fallback to high-quality placeholder with character info
-    fallback_images = {
-        "Asuna Yuuki": "https://via.placeholder.com/300x400/FF69B4/FFFFFF?text=Asuna+⚔️",
-        "C.C.": "https://via.placeholder.com/300x400/9370DB/FFFFFF?text=C.C.+🔮",
-        "Emilia": "https://via.placeholder.com/300x400/87CEEB/FFFFFF?text=Emilia+❄️",
-        "Erza Scarlet": "https://via.placeholder.com/300x400/DC143C/FFFFFF?text=Erza+⚔️",
-        "Hinata Hyūga": "https://via.placeholder.com/300x400/9370DB/FFFFFF?text=Hinata+👁️",
-        "Holo": "https://via.placeholder.com/300x400/DEB887/FFFFFF?text=Holo+🐺",
-        "Kurisu Makise": "https://via.placeholder.com/300x400/FF6347/FFFFFF?text=Kurisu+🧪",
-        "Mai Sakurajima": "https://via.placeholder.com/300x400/FF1493/FFFFFF?text=Mai+🎭",
-        "Maki Zenin": "https://via.placeholder.com/300x400/228B22/FFFFFF?text=Maki+👓",
-        "Marin Kitagawa": "https://via.placeholder.com/300x400/FFB6C1/FFFFFF?text=Marin+👗",
-        "Mitsuri Kanroji": "https://via.placeholder.com/300x400/FF69B4/FFFFFF?text=Mitsuri+🗾",
-        "Nezuko Kamado": "https://via.placeholder.com/300x400/FF69B4/FFFFFF?text=Nezuko+🌸",
-        "Nico Robin": "https://via.placeholder.com/300x400/4169E1/FFFFFF?text=Robin+📚",
-        "Nobara Kugisaki": "https://via.placeholder.com/300x400/FF4500/FFFFFF?text=Nobara+🔨",
-        "Power": "https://via.placeholder.com/300x400/FF6347/FFFFFF?text=Power+🩸",
-        "Rem": "https://via.placeholder.com/300x400/87CEEB/FFFFFF?text=Rem+💙",
-        "Rias Gremory": "https://via.placeholder.com/300x400/DC143C/FFFFFF?text=Rias+👹",
-        "Shinobu Kocho": "https://via.placeholder.com/300x400/9370DB/FFFFFF?text=Shinobu+🦋",
-        "Shinobu Oshino": "https://via.placeholder.com/300x400/FFD700/FFFFFF?text=Shinobu+🍩",
-        "Tohru": "https://via.placeholder.com/300x400/32CD32/FFFFFF?text=Tohru+🐉",
-        "Tsunade": "https://via.placeholder.com/300x400/228B22/FFFFFF?text=Tsunade+🎰",
-        "Yor Forger": "https://via.placeholder.com/300x400/DC143C/FFFFFF?text=Yor+🗡️",
-        "Yoruichi Shihōin": "https://via.placeholder.com/300x400/9370DB/FFFFFF?text=Yoruichi+⚡",
-        "Yukino Yukinoshita": "https://via.placeholder.com/300x400/87CEEB/FFFFFF?text=Yukino+❄️",
-        "Zero Two": "https://via.placeholder.com/300x400/FF69B4/FFFFFF?text=Zero+Two+🦄"
-    }
-    
-    return fallback_images.get(character_name, f"https://via.placeholder.com/300x400/808080/FFFFFF?text={character_name.replace(' ', '+')}")
+    """Get local character image path, or None if it hasn't been downloaded"""
+    image_path = local_image_path(character_name)
+    return str(image_path) if image_path else None
+
+def show_character_placeholder(character_name, width, key):
+    """Paint an inline placeholder in a portrait cell; the full image is added to the cell later"""
+    cell = st.container(key=f"portrait-{key}")
+    placeholders = get_placeholders(file_version(), file_version(PLACEHOLDERS_PATH))
+    data_uri = placeholders.get(character_name) or solid_placeholder(character_name)
+    cell.markdown(placeholder_html(data_uri, width), unsafe_allow_html=True)
+    return cell, character_name, width
 
 def main():
     initialize_session_state()
-    df, traits_norm, trait_cols = load_data()
+    version = file_version()
+    df, traits_norm, trait_cols = load_data(version)
+    match_index = sync_match_index(df, trait_cols, version)
     scenarios = get_scenarios()
     
     # Header
@@ -362,6 +270,19 @@ def main():
         elif st.session_state.assessment_complete:
             st.success("✅ Assessment Complete!")
         
+        st.header("🧮 Matching Metric")
+        kernel_names = list(KERNELS)
+        metric = st.selectbox(
+            "Score characters by",
+            kernel_names,
+            index=kernel_names.index(DEFAULT_KERNEL),
+            format_func=lambda name: KERNELS[name].label
+        )
+        kernel = match_index["kernels"][metric]
+        if kernel.stale_rows:
+            st.caption(f"ℹ️ {kernel.label} statistics were fitted on {kernel.fitted_rows} characters; "
+                       f"{kernel.stale_rows} added since (re-fitted at {REFIT_TOLERANCE:.0%} growth)")
+        
         st.header("🎯 How it works")
         st.markdown("""
         1. **Answer 20 scenarios** about personality preferences
@@ -397,6 +318,8 @@ def main():
             
             if st.button("🚀 Start Assessment", key="start_btn", use_container_width=True):
                 st.session_state.assessment_started = True
+                st.session_state.started_at = time.time()
+                st.session_state.question_shown_at = st.session_state.started_at
                 st.session_state.user_preferences = pd.Series(0.0, index=trait_cols)
                 st.rerun()
     
@@ -405,21 +328,28 @@ def main():
         st.markdown('<h2 style="text-align: center; color: #e91e63;">🏆 Your Ideal Matches! 🏆</h2>', unsafe_allow_html=True)
         
         # Calculate results
-        match_scores = traits_norm.values @ st.session_state.user_preferences.values
-        rank_df = pd.DataFrame({
-            'name': df['name'],
-            'summary': df['summary'],
-            'match_score': match_scores
-        }).sort_values('match_score', ascending=False).reset_index(drop=True)
+        match_scores = match_index["kernels"][metric].score(st.session_state.user_preferences.values)
+        rank_df = format_results(df['name'], df['summary'], match_scores)
+        
+        # Log the #1 match once per completed assessment
+        if not st.session_state.result_logged and len(rank_df) > 0:
+            started_at = st.session_state.started_at
+            get_event_sink().log(
+                "result",
+                sid=st.session_state.session_id,
+                top=rank_df.iloc[0]['name'],
+                metric=metric,
+                dur=round(time.time() - started_at, 2) if started_at else None
+            )
+            st.session_state.result_logged = True
         
         # Display top 5 matches
         st.markdown("### 🎯 Your Top 5 Matches")
+        image_slots = []
         
         for i in range(min(5, len(rank_df))):
             row = rank_df.iloc[i]
-            # Position-based percentage: 100% for 1st, decreasing by rank
-            total_chars = len(rank_df)
-            match_percentage = max(20, 100 - (i * (80 / max(total_chars - 1, 1))))
+            match_percentage = row['match_percentage']
             
             rank_emojis = ["🥇", "🥈", "🥉", "🏅", "🏅"]
             rank_emoji = rank_emojis[min(i, 4)]
@@ -428,9 +358,8 @@ def main():
             col1, col2 = st.columns([1, 3])
             
             with col1:
-                # Display character image (local or fallback)
-                image_path = get_character_image(row['name'])
-                st.image(image_path, width=200)
+                # Inline placeholder first; the full image is stacked over it once all cards have painted
+                image_slots.append(show_character_placeholder(row['name'], 200, f"top-{i}"))
             
             with col2:
                 st.markdown(f"""
@@ -444,6 +373,27 @@ def main():
             
             st.markdown("---")
         
+        # Similar characters to the #1 match
+        graph = match_index["graph"]
+        if graph is not None and len(rank_df) > 0:
+            top_name = rank_df.iloc[0]['name']
+            similar = graph.neighbours_by_name(top_name)
+            if similar:
+                st.markdown(f"### 💞 If You Like {top_name}, You Might Also Like")
+                similar_cols = st.columns(len(similar))
+                for j, (col, (name, similarity)) in enumerate(zip(similar_cols, similar)):
+                    with col:
+                        image_slots.append(show_character_placeholder(name, 120, f"similar-{j}"))
+                        st.write(f"**{name}**")
+                        st.caption(f"Similarity: {similarity:.0%}")
+        
+        # Progressive loading: once every card has painted, stack the full local
+        # images over their placeholders (see the portrait CSS above)
+        for cell, name, width in image_slots:
+            image_path = get_character_image(name)
+            if image_path:
+                cell.image(image_path, width=width)
+        
         # Show personality profile
         st.markdown("### 📊 Your Personality Profile")
         significant_prefs = st.session_state.user_preferences[abs(st.session_state.user_preferences) > 0.1]
@@ -481,11 +431,22 @@ def main():
         
         # Complete rankings
         with st.expander("📋 Complete Rankings (All Characters)", expanded=False):
-            for i, row in rank_df.iterrows():
-                # Position-based percentage for all characters
-                total_chars = len(rank_df)
-                match_percentage = max(20, 100 - (i * (80 / max(total_chars - 1, 1))))
-                st.write(f"**{i+1:2d}.** {row['name']:<25} | **{match_percentage:5.1f}%** | Score: {row['match_score']:+6.3f}")
+            # One paginated table, sliced server-side, instead of one widget per character
+            page_size = 50
+            total_pages = page_count(rank_df, page_size)
+            page = 1
+            if total_pages > 1:
+                page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, step=1)
+            st.dataframe(
+                results_page(rank_df, page, page_size),
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    'Match %': st.column_config.NumberColumn(format="%.1f%%"),
+                    'Percentile': st.column_config.NumberColumn(format="%.0f"),
+                    'Score': st.column_config.NumberColumn(format="%+.3f"),
+                }
+            )
         
         # Action buttons
         col1, col2 = st.columns(2)
@@ -558,6 +519,16 @@ def main():
         for i, (label, multiplier, choice, description) in enumerate(choices):
             with choice_cols[i]:
                 if st.button(label, key=f"choice_{i}", use_container_width=True):
+                    # Log answer (queued; written by a background thread)
+                    shown_at = st.session_state.question_shown_at
+                    get_event_sink().log(
+                        "answer",
+                        sid=st.session_state.session_id,
+                        scn=st.session_state.current_question,
+                        ch=CHOICE_CODES[i],
+                        lat=round(time.time() - shown_at, 2) if shown_at else None
+                    )
+                    
                     # Process choice
                     if multiplier > 0 and choice != "neutral":
                         chosen_vector_key = "vector_a" if choice == "a" else "vector_b"
@@ -580,6 +551,7 @@ def main():
                     
                     # Move to next question
                     st.session_state.current_question += 1
+                    st.session_state.question_shown_at = time.time()
                     
                     if st.session_state.current_question >= len(scenarios):
                         st.session_state.assessment_complete = True